@@ -111,6 +111,12 @@ class KalshiConfig(BaseModel):
     backoff_multiplier: float = Field(default=2.0, description="Exponential backoff multiplier")
     max_delay: float = Field(default=30.0, description="Max total delay before failing (seconds)")
     orderbook_depth: int = Field(default=10, description="Default orderbook depth")
+    max_concurrency: int = Field(default=1, description="Max in-flight requests (1 = strictly serial worker)")
+    get_cache_ttl: float = Field(default=0.25, description="TTL for cached GET responses (seconds; 0 disables)")
+    sign_cache_bucket_ms: int = Field(
+        default=1,
+        description="Coarsen signing timestamps to this bucket and reuse signatures within it (ms; 0 disables; 1 never alters timestamps)",
+    )
 
     @property
     def base_url(self) -> str:
@@ -154,6 +160,22 @@ class Config(BaseModel):
     portfolio_manager: PortfolioManagerConfig = Field(..., description="Portfolio manager sizing and guardrails")
 
 
+_cached_config: Config | None = None
+
+
+def get_config(*, refresh: bool = False) -> Config:
+    """Return the application Config, loading and validating it once per process.
+
+    `load_config()` re-reads `.env` and re-runs Pydantic validation on every
+    call; long-running callers should use this cached accessor instead. Pass
+    `refresh=True` to force a reload.
+    """
+    global _cached_config
+    if _cached_config is None or refresh:
+        _cached_config = load_config()
+    return _cached_config
+
+
 def load_config() -> Config:
     """Load application configuration from environment variables.
 
@@ -171,7 +193,7 @@ def load_config() -> Config:
     # override=True so .env wins over IDE envFile (avoids truncated/inconsistent private key)
     dotenv.load_dotenv(env_file, override=True)
 
-    kalshi = KalshiConfig(
+    kalshi_kwargs = dict(
         api_key=_get_required_env("KALSHI_API_KEY"),
         private_key=_get_required_env("KALSHI_PRIVATE_KEY"),
         use_demo=_get_env_bool("KALSHI_USE_DEMO", True),
@@ -181,11 +203,30 @@ def load_config() -> Config:
         backoff_multiplier=_get_env_number("KALSHI_BACKOFF_MULTIPLIER", 2.0, float),
         max_delay=_get_env_number("KALSHI_MAX_DELAY", 30.0, float),
         orderbook_depth=_get_env_number("KALSHI_ORDERBOOK_DEPTH", 10, int),
+        max_concurrency=_get_env_number("KALSHI_MAX_CONCURRENCY", 1, int),
+        get_cache_ttl=_get_env_number("KALSHI_GET_CACHE_TTL", 0.25, float),
+        sign_cache_bucket_ms=_get_env_number("KALSHI_SIGN_CACHE_BUCKET_MS", 1, int),
     )
-    portfolio_manager = PortfolioManagerConfig(
+    pm_kwargs = dict(
         kelly_fraction=_get_env_number("PM_KELLY_FRACTION", 0.25, float),
         min_edge_threshold=_get_env_number("PM_MIN_EDGE_THRESHOLD", 0.05, float),
         max_position_fraction=_get_env_number("PM_MAX_POSITION_FRACTION", 0.05, float),
         bankroll=_get_required_env_float("PM_BANKROLL"),
     )
-    return Config(kalshi=kalshi, portfolio_manager=portfolio_manager)
\ No newline at end of file
+
+    # Skip re-validation when the environment hasn't changed since the last
+    # load; the PEM startswith/endswith scans are the expensive part.
+    global _validated_cache
+    snapshot = (tuple(kalshi_kwargs.items()), tuple(pm_kwargs.items()))
+    if _validated_cache is not None and _validated_cache[0] == snapshot:
+        return _validated_cache[1]
+
+    config = Config(
+        kalshi=KalshiConfig(**kalshi_kwargs),
+        portfolio_manager=PortfolioManagerConfig(**pm_kwargs),
+    )
+    _validated_cache = (snapshot, config)
+    return config
+
+
+_validated_cache: tuple[tuple, Config] | None = None
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""Shared event-loop thread for synchronous entry points.
+
+Sync callers (scripts, notebooks) that wrap each call in `asyncio.run()` pay
+a fresh event loop per call and lose everything bound to the old one — the
+client's request worker, pooled connections, and in-flight caches. `run_sync`
+routes all sync->async bridging through one lazily started daemon thread
+running a single persistent loop, so those objects live across calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the shared background event loop."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="kalshi-sync-loop", daemon=True).start()
+            _loop = loop
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion on the shared loop thread and return its result.
+
+    Must be called from synchronous code. Calling it from a coroutine —
+    including one already running on the shared loop, which would deadlock
+    waiting on itself — raises instead; async callers should just await.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("run_sync() called from async code; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, _ensure_loop()).result()
@@ -15,20 +15,66 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import contextlib
+import functools
+import json
+import logging
 import random
+import ssl
 import time
 from typing import Any, Final
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 
 import requests #type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator (pip install .[speed])
+    orjson = None  # type: ignore[assignment]
+
+from cryptography.hazmat.backends.openssl import backend as _openssl_backend #type: ignore
 from cryptography.hazmat.primitives import hashes #type: ignore
-from cryptography.hazmat.primitives.asymmetric import padding #type: ignore
+from cryptography.hazmat.primitives.asymmetric import padding, rsa #type: ignore
 from cryptography.hazmat.primitives.serialization import load_pem_private_key #type: ignore
 
 from config import KalshiConfig
 
+from ._runtime import run_sync
+
 from .rate_limit import TokenBucketRateLimiter
-from .models import KalshiBalance, KalshiMarket, KalshiOrder, KalshiOrderBook, KalshiPosition
+from .models import (
+    MARKET_LIST_ADAPTER,
+    ORDER_LIST_ADAPTER,
+    POSITION_LIST_ADAPTER,
+    KalshiBalance,
+    KalshiMarket,
+    KalshiOrder,
+    KalshiOrderBook,
+    KalshiPosition,
+)
+
+logger = logging.getLogger(__name__)
+
+# OpenSSL >= 1.1.1 dispatches to AES-NI/SHA-NI at runtime and supports TLS 1.3;
+# anything older means TLS + SHA-256 signing run without hardware acceleration.
+_MIN_OPENSSL_VERSION: Final[int] = 0x10101000
+
+
+def _check_crypto_backend() -> None:
+    """Log the active TLS/crypto backend and warn if it predates OpenSSL 1.1.1."""
+    version = _openssl_backend.openssl_version_number()
+    if version < _MIN_OPENSSL_VERSION:
+        logger.warning(
+            "cryptography is linked against an old OpenSSL (%#x); TLS and SHA-256 "
+            "will not use hardware acceleration: %s",
+            version,
+            ssl.OPENSSL_VERSION,
+        )
+    else:
+        logger.debug("TLS/crypto backend: %s", ssl.OPENSSL_VERSION)
+
+
+_check_crypto_backend()
 
 
 class KalshiClient:
@@ -39,8 +85,9 @@ class KalshiClient:
     - Kalshi private key: `private_key`
     - Config: `config`
     - Base URL: `base_url` (computed from KALSHI_USE_DEMO via config)
-    - Request Queue: `request_queue` (single asyncio.Queue)
-    - Dedicated Worker Task: `_request_worker_task` (single background task)
+    - Request Queue: `request_queue` (single asyncio.Queue, contended serial path)
+    - Dedicated Worker Task: `_request_worker_task` (single background task,
+      started lazily; the uncontended serial path bypasses it under `_serial_lock`)
     - Rate Limiter: `rate_limiter` (token bucket)
     """
 
@@ -48,16 +95,114 @@ class KalshiClient:
         """Create a client using the given credentials and tuning configuration."""
         self.config = config
         self.api_key: str = config.api_key
+        # requests accepts bytes header values; encoding the key once avoids a
+        # UTF-8 round-trip per request when the header dict goes on the wire.
+        self._api_key_bytes: bytes = config.api_key.encode("utf-8")
         self.private_key = _load_private_key(config.private_key)
 
+        # Signing is on the hot path of every request; build the PSS padding
+        # and hash algorithm objects once instead of per call.
+        self._pss_padding = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH
+        )
+        self._hash_algo = hashes.SHA256()
+
         # Computed from KALSHI_USE_DEMO / config.use_demo
         self.base_url: str = config.base_url
 
         # Central request queue: (method, path, body, future)
         self.request_queue: asyncio.Queue[tuple[str, str, Any | None, asyncio.Future[Any]]] = asyncio.Queue()
 
+        # Persistent session: keep-alive + connection pooling avoids a fresh
+        # TCP+TLS handshake per request against the single Kalshi host.
+        self._session = requests.Session()
+        self._session.headers["Connection"] = "keep-alive"
+        # Skip the per-request environment scan (proxies, .netrc, REQUESTS_CA_BUNDLE);
+        # this client only ever talks to the one configured Kalshi host.
+        self._session.trust_env = False
+        # pool_maxsize tracks max_concurrency so a concurrent worker never
+        # discards pooled connections under load.
+        self._session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=max(20, config.max_concurrency),
+                max_retries=0,
+            ),
+        )
+
         self.rate_limiter = TokenBucketRateLimiter(rate=config.rate_limit)
         self._request_worker_task: asyncio.Task[None] | None = None
+        # Serial-mode mutual exclusion shared by the direct fast path and the
+        # worker: HTTP stays one-at-a-time whichever path a request takes.
+        self._serial_lock = asyncio.Lock()
+        # Concurrency gate for direct dispatch (created lazily on the running
+        # loop, only used when max_concurrency > 1).
+        self._semaphore: asyncio.Semaphore | None = None
+
+        # Short-TTL cache for GET responses: back-to-back reads of the same
+        # endpoint (e.g. balance + portfolio value) share one signed round-trip.
+        self._get_cache: dict[str, tuple[float, Any]] = {}
+        # In-flight GETs by path (only consulted when the GET cache is on):
+        # concurrent callers for the same path await one future instead of
+        # each firing their own request.
+        self._get_inflight: dict[str, asyncio.Future[Any]] = {}
+
+        # Signature cache, only populated when sign_cache_bucket_ms > 0: calls
+        # that sign the same (method, path, bucketed timestamp) reuse one RSA op.
+        self._sig_cache: dict[tuple[str, str, str], bytes] = {}
+
+        # The method+path suffix of the signing message is invariant per
+        # endpoint; cache its encoded bytes so hot polling paths skip the
+        # per-request str.encode.
+        self._sig_suffix_cache: dict[tuple[str, str], bytes] = {}
+
+        # Full URL per path: hot loops poll the same handful of endpoints, so
+        # the base_url concat is paid once per path instead of per request.
+        self._url_cache: dict[str, str] = {}
+
+        # Dedicated RNG for retry jitter: a bound method on our own instance
+        # avoids the module-function indirection and any contention on the
+        # global random state.
+        self._rng = random.Random()
+
+        # Backoff schedule is a pure function of the config, so precompute
+        # (delay, jitter_cap) per retry attempt: the retry path indexes a
+        # tuple instead of paying a pow and two multiplies.
+        self._retry_delays: tuple[tuple[float, float], ...] = tuple(
+            (d, d * 0.1)
+            for d in (
+                config.base_delay * config.backoff_multiplier**i
+                for i in range(max(config.max_attempt - 1, 0))
+            )
+        )
+
+    def close(self) -> None:
+        """Release the underlying HTTP connection pool."""
+        self._session.close()
+
+    async def aclose(self) -> None:
+        """Stop the background worker (if started) and release the pool.
+
+        Safe to call whether or not the worker task ever started, so callers
+        can tear down with a single `await client.aclose()` instead of the
+        cancel/suppress(CancelledError) boilerplate.
+        """
+        task = self._request_worker_task
+        if task is not None:
+            self._request_worker_task = None
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self.close()
+
+    async def __aenter__(self) -> "KalshiClient":
+        """Enter `async with` scope; no setup needed beyond __init__."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Tear the client down on `async with` exit."""
+        await self.aclose()
 
     def _ensure_worker_started(self) -> None:
         """Start the single background worker task (lazily)."""
@@ -67,44 +212,96 @@ class KalshiClient:
         self._request_worker_task = loop.create_task(self._request_worker(), name="kalshi-request-worker")
 
     async def _enqueue_request(self, method: str, path: str, body: Any | None) -> Any:
-        """Enqueue a request and await its result."""
+        """Dispatch a request and await its result.
+
+        In the default serial mode the request rides the queue to the single
+        worker task. With `max_concurrency > 1` the caller's own task runs the
+        request directly under a shared semaphore: same concurrency bound, but
+        without the queue put, future, and double task-switch per request.
+        """
+        if self.config.max_concurrency > 1:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+            async with self._semaphore:
+                return await self._send_with_retries(method, path, body)
+
+        # Serial fast path: nothing queued and nothing in flight, so run on
+        # the caller's task under the serial lock — no queue put, no future,
+        # no worker wakeup (and an idle client never starts the worker task).
+        if not self._serial_lock.locked() and self.request_queue.empty():
+            async with self._serial_lock:
+                return await self._send_with_retries(method, path, body)
+
         self._ensure_worker_started()
         fut: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
         await self.request_queue.put((method, path, body, fut))
         return await fut
 
     async def _request_worker(self) -> None:
-        """Consume the queue serially, resolve futures with results/errors."""
+        """Consume the queue serially, resolving futures with results/errors."""
         while True:
             method, path, body, fut = await self.request_queue.get()
             try:
-                result = await self._send_with_retries(method, path, body)
-            except Exception as exc:  # noqa: BLE001 - propagate into awaiting task
-                if not fut.cancelled():
-                    fut.set_exception(exc)
-            else:
-                if not fut.cancelled():
-                    fut.set_result(result)
+                await self._resolve_queued_request(method, path, body, fut)
             finally:
                 self.request_queue.task_done()
 
-    def _sign_request(self, method: str, path: str) -> tuple[str, str]:
+    async def _resolve_queued_request(
+        self, method: str, path: str, body: Any | None, fut: asyncio.Future[Any]
+    ) -> None:
+        """Send one request and settle its future (never raises)."""
+        try:
+            async with self._serial_lock:
+                result = await self._send_with_retries(method, path, body)
+        except Exception as exc:  # noqa: BLE001 - propagate into awaiting task
+            if not fut.cancelled():
+                fut.set_exception(exc)
+        else:
+            if not fut.cancelled():
+                fut.set_result(result)
+
+    def _sign_request(self, method: str, path: str, timestamp_ms: str) -> bytes:
         """Sign a request per Kalshi auth docs.
 
         Message format: `timestamp_ms + HTTP_METHOD + path_without_query`.
-        Returns `(timestamp_ms, signature_base64)`.
+        The caller supplies `timestamp_ms` so the signed timestamp and the
+        `KALSHI-ACCESS-TIMESTAMP` header are always the same value.
+        Returns the base64-encoded signature as bytes, ready for the header.
         """
         method_upper: Final[str] = method.upper()
-        path_without_query: Final[str] = path.split("?", 1)[0]
-        timestamp_ms = str(int(time.time() * 1000))
-        message = f"{timestamp_ms}{method_upper}{path_without_query}".encode("utf-8")
-
-        signature = self.private_key.sign(
-            message,
-            padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH),
-            hashes.SHA256(),
-        )
-        return timestamp_ms, base64.b64encode(signature).decode("utf-8")
+        # Most signed paths (orders, cancels, balance) carry no query at all;
+        # skip the split + list allocation unless one is present.
+        path_without_query: Final[str] = path.partition("?")[0] if "?" in path else path
+
+        cache_key: tuple[str, str, str] | None = None
+        if self.config.sign_cache_bucket_ms > 0:
+            cache_key = (method_upper, path_without_query, timestamp_ms)
+            cached = self._sig_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Concatenate bytes directly: all pieces are ASCII, and the
+        # method+path suffix is cached per endpoint so repeat requests skip
+        # both encodes and one concatenation.
+        suffix_key = (method_upper, path_without_query)
+        suffix = self._sig_suffix_cache.get(suffix_key)
+        if suffix is None:
+            method_bytes = _METHOD_BYTES.get(method_upper)
+            if method_bytes is None:
+                method_bytes = method_upper.encode("ascii")
+            suffix = method_bytes + path_without_query.encode("ascii")
+            if len(self._sig_suffix_cache) >= 512:
+                self._sig_suffix_cache.clear()
+            self._sig_suffix_cache[suffix_key] = suffix
+        message = timestamp_ms.encode("ascii") + suffix
+        signature = self.private_key.sign(message, self._pss_padding, self._hash_algo)
+        encoded = base64.b64encode(signature)
+
+        if cache_key is not None:
+            if len(self._sig_cache) >= 512:
+                self._sig_cache.clear()
+            self._sig_cache[cache_key] = encoded
+        return encoded
 
     async def _send_request(self, method: str, path: str, body: Any | None) -> Any:
         """Sign and send a request, returning the decoded JSON response.
@@ -113,42 +310,119 @@ class KalshiClient:
         - `KalshiHttpError` for non-2xx responses
         - `requests.RequestException` for transport errors
         """
-        timestamp_ms, signature = self._sign_request(method, path)
+        url = self._url_cache.get(path)
+        if url is None:
+            if len(self._url_cache) >= 1024:
+                self._url_cache.clear()
+            url = self.base_url + path
+            self._url_cache[path] = url
+        return await asyncio.to_thread(self._do_request, method, path, url, body)
+
+    def _do_request(self, method: str, path: str, url: str, body: Any | None) -> Any:
+        """Sign and execute the HTTP request synchronously (runs in a worker thread).
+
+        Signing happens here rather than on the event loop: an RSA-PSS sign is
+        ~1ms of CPU and OpenSSL releases the GIL, so doing it in the thread
+        keeps the loop responsive and lets it overlap other loop work.
+        """
+        # time_ns() is a single C call with no float round-trip or object churn.
+        now_ms = time.time_ns() // 1_000_000
+        bucket_ms = self.config.sign_cache_bucket_ms
+        if bucket_ms > 1:
+            # Coarsened timestamps let bursts of calls share one signature; only
+            # enable when the server's clock-skew tolerance covers the bucket.
+            now_ms -= now_ms % bucket_ms
+        timestamp_ms = str(now_ms)
+        signature = self._sign_request(method, path, timestamp_ms)
 
         headers = {
-            "KALSHI-ACCESS-KEY": self.api_key,
+            "KALSHI-ACCESS-KEY": self._api_key_bytes,
             "KALSHI-ACCESS-SIGNATURE": signature,
             "KALSHI-ACCESS-TIMESTAMP": timestamp_ms,
         }
+        # Bodies are encoded here (once) and sent as bytes; requests' json=
+        # path would re-serialize with the stdlib encoder on every attempt.
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+            resp = self._session.request(
+                method, url, headers=headers, data=_encode_json_body(body), timeout=30
+            )
+        else:
+            resp = self._session.request(method, url, headers=headers, timeout=30)
+        if 200 <= resp.status_code < 300:
+            if not resp.content:
+                return None
+            return _parse_json_response(resp)
+
+        error_payload: dict[str, Any] | None
+        try:
+            error_payload = _parse_json_response(resp)
+        except Exception:  # noqa: BLE001 - best-effort parsing
+            error_payload = None
+        raise KalshiHttpError(status_code=resp.status_code, payload=error_payload)
 
-        url = self.base_url + path
-
-        def _do_request() -> Any:
-            """Execute the HTTP request synchronously (runs in a worker thread)."""
-            resp = requests.request(method, url, headers=headers, json=body, timeout=30)
-            if 200 <= resp.status_code < 300:
-                if not resp.content:
-                    return None
-                return resp.json()
+    async def _send_with_retries(self, method: str, path: str, body: Any | None) -> Any:
+        """Send a request with spec-defined retry/backoff behavior.
 
-            error_payload: dict[str, Any] | None
+        GET responses are cached for `config.get_cache_ttl` seconds (0
+        disables), and while one cacheable GET is in flight, concurrent
+        callers for the same path await its outcome instead of issuing
+        duplicate requests (single-flight).
+        """
+        if method == "GET" and self.config.get_cache_ttl > 0:
+            cached = self._get_cache.get(path)
+            if cached is not None and (time.monotonic() - cached[0]) < self.config.get_cache_ttl:
+                return cached[1]
+
+            inflight = self._get_inflight.get(path)
+            if inflight is not None:
+                # Shielded so one waiter's cancellation doesn't kill the
+                # request the leader (and other waiters) depend on.
+                return await asyncio.shield(inflight)
+
+            fut: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+            self._get_inflight[path] = fut
             try:
-                error_payload = resp.json()
-            except Exception:  # noqa: BLE001 - best-effort parsing
-                error_payload = None
-            raise KalshiHttpError(status_code=resp.status_code, payload=error_payload)
+                result = await self._retry_request(method, path, body, use_cache=True)
+            except BaseException as exc:
+                fut.set_exception(exc)
+                fut.exception()  # mark retrieved; waiters re-raise their own copy
+                raise
+            else:
+                fut.set_result(result)
+                return result
+            finally:
+                self._get_inflight.pop(path, None)
 
-        return await asyncio.to_thread(_do_request)
+        return await self._retry_request(method, path, body, use_cache=False)
 
-    async def _send_with_retries(self, method: str, path: str, body: Any | None) -> Any:
-        """Send a request with spec-defined retry/backoff behavior."""
+    async def _retry_request(self, method: str, path: str, body: Any | None, *, use_cache: bool) -> Any:
+        """Run the rate-limited retry/backoff loop for one request."""
         attempt = 0
-        start = time.monotonic()
+        start: float | None = None
 
         while True:
             try:
-                await self.rate_limiter.acquire()
-                return await self._send_request(method, path, body)
+                # Reuse the limiter's clock reading for retry bookkeeping and
+                # the cache stamp instead of re-reading monotonic each time.
+                now = await self.rate_limiter.acquire()
+                if start is None:
+                    start = now
+                result = await self._send_request(method, path, body)
+                if use_cache:
+                    # Cap the cache so cursor-walk paths (a unique query
+                    # string per page) can't grow it without bound: sweep
+                    # expired entries at the threshold, and clear outright if
+                    # the live set alone still exceeds it.
+                    if len(self._get_cache) >= 256:
+                        cutoff = now - self.config.get_cache_ttl
+                        self._get_cache = {
+                            k: v for k, v in self._get_cache.items() if v[0] > cutoff
+                        }
+                        if len(self._get_cache) >= 256:
+                            self._get_cache.clear()
+                    self._get_cache[path] = (now, result)
+                return result
             except Exception as exc:  # noqa: BLE001 - classify and retry/raise
                 attempt += 1
                 if not _is_retryable_error(exc):
@@ -156,8 +430,8 @@ class KalshiClient:
                 if attempt >= self.config.max_attempt:
                     raise
 
-                delay = self.config.base_delay * (self.config.backoff_multiplier ** (attempt - 1))
-                delay += random.uniform(0.0, delay * 0.1)  # small jitter
+                delay, jitter_cap = self._retry_delays[attempt - 1]
+                delay += self._rng.uniform(0.0, jitter_cap)  # small jitter
 
                 if (time.monotonic() - start) + delay > self.config.max_delay:
                     raise
@@ -170,26 +444,37 @@ class KalshiClient:
         - Lists/tuples are encoded as comma-separated values.
         - Booleans are encoded as "true"/"false".
         """
-        filtered: dict[str, str] = {}
+        # Fast paths for the hottest call shapes. Single int param covers
+        # orderbook depth; a bare integer limit with no filters covers the
+        # default listing plus the bulk polling sweeps (limit=200).
+        if len(params) == 1:
+            ((key, value),) = params.items()
+            if type(value) is int:
+                return f"?{key}={value}"
+        limit = params.get("limit")
+        if type(limit) is int and all(v is None for k, v in params.items() if k != "limit"):
+            return _DEFAULT_LIMIT_QUERY if limit == 100 else f"?limit={limit}"
+
+        # Single pass straight into the parts list: our keys are literal
+        # identifiers that never need quoting, so only values go through
+        # quote_plus and the urlencode() round-trip via a filtered dict is
+        # skipped entirely.
+        parts: list[str] = []
         for key, value in params.items():
             if value is None:
                 continue
-            if isinstance(value, bool):
-                filtered[key] = "true" if value else "false"
-            elif isinstance(value, (list, tuple)):
-                filtered[key] = ",".join(str(v) for v in value)
-            else:
-                filtered[key] = str(value)
+            encode = _QUERY_VALUE_ENCODERS.get(type(value), str)
+            parts.append(key + "=" + quote_plus(encode(value)))
 
-        if not filtered:
+        if not parts:
             return ""
-        return "?" + urlencode(filtered)
+        return "?" + "&".join(parts)
 
     def _normalize_ticker(self, ticker):
         """Convert a single ticker value to uppercase (or None if not provided)."""
         if ticker is None:
             return None
-        return str(ticker).upper()
+        return _normalize_ticker_cached(str(ticker))
 
     def _normalize_tickers(self, tickers):
         """Convert one-or-many tickers to uppercase.
@@ -206,9 +491,22 @@ class KalshiClient:
 
         tickers_str = str(tickers)
         if "," in tickers_str:
-            return [self._normalize_ticker(t.strip()) for t in tickers_str.split(",") if t.strip()]
+            # One C-level replace for the whole string instead of strip() per
+            # piece, then normalize each non-empty segment.
+            compact = tickers_str.replace(" ", "")
+            return [_normalize_ticker_cached(t) for t in compact.split(",") if t]
         return self._normalize_ticker(tickers_str)
 
+    async def fetch_many(self, calls: list[tuple[str, str, Any | None]]) -> list[Any]:
+        """Issue several raw `(method, path, body)` requests and await all results.
+
+        All calls share the pooled session, signing key, and rate limiter, and
+        results come back in input order. How much actually overlaps is up to
+        the request worker; batching here keeps callers free of future
+        bookkeeping either way.
+        """
+        return list(await asyncio.gather(*(self._enqueue_request(m, p, b) for m, p, b in calls)))
+
     async def get_market(self, ticker: str) -> KalshiMarket:
         """Get a single market by ticker."""
         ticker = self._normalize_ticker(ticker)
@@ -241,13 +539,95 @@ class KalshiClient:
             }
         )
         response = await self._enqueue_request("GET", f"/trade-api/v2/markets{query}", None)
-        return [KalshiMarket.from_api(m) for m in response.get("markets", [])]
+        return MARKET_LIST_ADAPTER.validate_python(response.get("markets", []))
+
+    async def get_markets_all(
+        self,
+        series_ticker: str | None = None,
+        event_ticker: str | None = None,
+        status: str | None = None,
+        page_limit: int = 100,
+    ) -> list[KalshiMarket]:
+        """Fetch all markets matching the filters, walking cursor pages.
+
+        Pages are fetched over the pooled keep-alive connection, so a full walk
+        costs one TLS handshake rather than one per page.
+        """
+        results: list[KalshiMarket] = []
+        cursor: str | None = None
+        while True:
+            query = self._build_query_string(
+                {
+                    "limit": page_limit,
+                    "cursor": cursor,
+                    "event_ticker": self._normalize_ticker(event_ticker),
+                    "series_ticker": self._normalize_ticker(series_ticker),
+                    "status": status,
+                }
+            )
+            response = await self._enqueue_request("GET", f"/trade-api/v2/markets{query}", None)
+            results.extend(MARKET_LIST_ADAPTER.validate_python(response.get("markets", [])))
+            cursor = response.get("cursor") or None
+            if cursor is None:
+                break
+        return results
+
+    async def get_market_tickers(
+        self,
+        series_ticker: str | None = None,
+        event_ticker: str | None = None,
+        status: str | None = None,
+        page_limit: int = 100,
+    ) -> list[str]:
+        """Fetch only market tickers across all cursor pages.
+
+        Skips per-market model validation entirely - callers that just need
+        ticker strings (e.g. discovery scans) avoid allocating thousands of
+        KalshiMarket objects they would immediately throw away.
+        """
+        tickers: list[str] = []
+        cursor: str | None = None
+        while True:
+            query = self._build_query_string(
+                {
+                    "limit": page_limit,
+                    "cursor": cursor,
+                    "event_ticker": self._normalize_ticker(event_ticker),
+                    "series_ticker": self._normalize_ticker(series_ticker),
+                    "status": status,
+                }
+            )
+            response = await self._enqueue_request("GET", f"/trade-api/v2/markets{query}", None)
+            tickers.extend(m["ticker"] for m in response.get("markets", []) if "ticker" in m)
+            cursor = response.get("cursor") or None
+            if cursor is None:
+                break
+        return tickers
 
     async def get_event(self, event_ticker: str) -> dict[str, Any]:
         """Get a single event by ticker."""
         event_ticker = self._normalize_ticker(event_ticker)
         return await self._enqueue_request("GET", f"/trade-api/v2/events/{event_ticker}", None)
 
+    async def get_events(
+        self,
+        series_ticker: str | None = None,
+        status: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get events with optional filters/pagination."""
+        query = self._build_query_string(
+            {
+                "limit": limit,
+                "cursor": cursor,
+                "series_ticker": self._normalize_ticker(series_ticker),
+                "status": status,
+            }
+        )
+        response = await self._enqueue_request("GET", f"/trade-api/v2/events{query}", None)
+        return response.get("events", [])
+
     async def get_series(self, series_ticker: str) -> dict[str, Any]:
         """Get a series by ticker."""
         series_ticker = self._normalize_ticker(series_ticker)
@@ -273,7 +653,7 @@ class KalshiClient:
             }
         )
         response = await self._enqueue_request("GET", f"/trade-api/v2/portfolio/orders{query}", None)
-        return [KalshiOrder.from_api(o) for o in response.get("orders", [])]
+        return ORDER_LIST_ADAPTER.validate_python(response.get("orders", []))
 
     async def get_order(self, order_id: str) -> KalshiOrder:
         """Get a single order by its order_id."""
@@ -293,18 +673,22 @@ class KalshiClient:
 
     async def batch_create_orders(self, requests_list: list[KalshiOrder]) -> list[KalshiOrder]:
         """Create multiple orders in one request."""
-        body = {"orders": [_order_to_create_body(o, normalize_ticker=self._normalize_ticker) for o in requests_list]}
+        normalize = self._normalize_ticker
+        body = {"orders": [_order_to_create_body(o, normalize_ticker=normalize) for o in requests_list]}
         response = await self._enqueue_request("POST", "/trade-api/v2/portfolio/orders/batched", body)
 
-        results: list[KalshiOrder] = []
+        # Two phases: a cheap error scan over the raw items first, then one
+        # pydantic-core pass over all order payloads together, instead of
+        # interleaving per-item validation with the error checks.
+        payloads: list[dict[str, Any]] = []
         for item in response.get("orders", []):
             if item.get("error") is not None:
                 raise KalshiHttpError(status_code=400, payload=item.get("error"))
             order_payload = item.get("order")
             if order_payload is None:
                 raise KalshiHttpError(status_code=500, payload={"message": "Missing order in batch response"})
-            results.append(KalshiOrder.from_api(order_payload))
-        return results
+            payloads.append(order_payload)
+        return ORDER_LIST_ADAPTER.validate_python(payloads)
 
     async def batch_cancel_orders(self, order_ids: list[str]) -> None:
         """Cancel multiple orders in one request."""
@@ -335,13 +719,122 @@ class KalshiClient:
             }
         )
         response = await self._enqueue_request("GET", f"/trade-api/v2/portfolio/positions{query}", None)
-        return [KalshiPosition.from_api(p) for p in response.get("market_positions", [])]
+        return POSITION_LIST_ADAPTER.validate_python(response.get("market_positions", []))
+
 
+class KalshiClientSync:
+    """Blocking facade over `KalshiClient` for scripts and notebooks.
 
+    Every call is submitted to the shared loop thread (`_runtime.run_sync`),
+    so the wrapped client — its parsed key, pooled session, caches, and
+    worker — persists across calls instead of dying with a per-call
+    `asyncio.run()` loop. Async code should use `KalshiClient` directly.
+    """
+
+    def __init__(self, config: KalshiConfig):
+        """Create the facade and its underlying async client."""
+        self._client = KalshiClient(config)
+
+    def __getattr__(self, name: str) -> Any:
+        """Expose the async client's surface, wrapping coroutine methods in run_sync."""
+        attr = getattr(self._client, name)
+        if not asyncio.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return run_sync(attr(*args, **kwargs))
+
+        # Cache the wrapper so repeat calls skip __getattr__ entirely.
+        self.__dict__[name] = call
+        return call
+
+    def close(self) -> None:
+        """Release the underlying HTTP connection pool."""
+        self._client.close()
+
+
+# Hot loops hit the same handful of tickers and the default listing shape over
+# and over; cache the derived strings instead of recomputing them per call.
+_DEFAULT_LIMIT_QUERY: Final[str] = "?limit=100"
+
+# Pre-encoded HTTP method names for the signing message.
+_METHOD_BYTES: Final[dict[str, bytes]] = {
+    "GET": b"GET",
+    "POST": b"POST",
+    "PUT": b"PUT",
+    "DELETE": b"DELETE",
+    "PATCH": b"PATCH",
+}
+
+# Exact-type dispatch for query param encoding: one dict lookup per value
+# instead of an isinstance chain (bool must be handled before falling back to
+# str(), and lists/tuples encode comma-separated).
+_QUERY_VALUE_ENCODERS: Final[dict[type, Any]] = {
+    bool: lambda v: "true" if v else "false",
+    list: lambda v: ",".join(str(x) for x in v),
+    tuple: lambda v: ",".join(str(x) for x in v),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_ticker_cached(ticker: str) -> str:
+    """Uppercase a ticker, memoized across calls."""
+    # Tickers arriving from the API are already uppercase; isupper() is an
+    # allocation-free C scan, so check before paying for the upper() copy.
+    return ticker if ticker.isupper() else ticker.upper()
+
+
+def _encode_json_body(body: Any) -> bytes:
+    """Encode a request body as compact JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+
+def _parse_json_response(resp: requests.Response) -> Any:
+    """Decode a JSON response body, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+@functools.lru_cache(maxsize=8)
 def _load_private_key(pem_str: str):
-    """Load RSA private key from PEM string (handles \\n from .env)."""
+    """Load RSA private key from PEM string (handles \\n from .env).
+
+    Memoized per PEM: parsing and CRT validation are expensive, and every
+    client built from the same config reuses one key object (signing on a
+    cryptography key is thread-safe).
+    """
     pem_bytes = pem_str.strip().replace("\\n", "\n").encode("utf-8")
-    return load_pem_private_key(pem_bytes, password=None)
+    return _ensure_crt_form(load_pem_private_key(pem_bytes, password=None))
+
+
+def _ensure_crt_form(key):
+    """Return an RSA key that carries CRT coefficients (dmp1/dmq1/iqmp).
+
+    OpenSSL signs roughly 4x faster with the CRT form. PEMs from standard
+    tooling include the coefficients, but a bare `(n, e, d)` key would silently
+    fall back to classical RSA; rebuild the CRT components in that case.
+    """
+    if not isinstance(key, rsa.RSAPrivateKey):
+        return key
+    numbers = key.private_numbers()
+    if numbers.dmp1 and numbers.dmq1 and numbers.iqmp:
+        return key
+
+    public = numbers.public_numbers
+    p, q = rsa.rsa_recover_prime_factors(public.n, public.e, numbers.d)
+    return rsa.RSAPrivateNumbers(
+        p=p,
+        q=q,
+        d=numbers.d,
+        dmp1=rsa.rsa_crt_dmp1(numbers.d, p),
+        dmq1=rsa.rsa_crt_dmq1(numbers.d, q),
+        iqmp=rsa.rsa_crt_iqmp(p, q),
+        public_numbers=public,
+    ).private_key()
 
 
 class KalshiHttpError(RuntimeError):
@@ -364,6 +857,13 @@ def _is_retryable_error(exc: BaseException) -> bool:
     return isinstance(exc, requests.RequestException)
 
 
+def _fmt_price(value: float) -> str:
+    """Format price fields using the API's fixed-point convention."""
+    # "%"-interpolation hits the C float formatter directly, skipping the
+    # __format__ dispatch an f-string pays per call.
+    return "%.4f" % value
+
+
 def _order_to_create_body(order: KalshiOrder, *, normalize_ticker) -> dict[str, Any]:
     """Convert a KalshiOrder into a Create Order request body.
 
@@ -391,10 +891,6 @@ def _order_to_create_body(order: KalshiOrder, *, normalize_ticker) -> dict[str,
     if order.type is not None:
         body["type"] = order.type
 
-    def _fmt_price(value: float) -> str:
-        """Format price fields using the API's fixed-point convention."""
-        return f"{value:.4f}"
-
     if order.side == "yes" and order.yes_price_dollars is not None:
         body["yes_price_dollars"] = _fmt_price(order.yes_price_dollars)
     if order.side == "no" and order.no_price_dollars is not None:
@@ -6,10 +6,11 @@ They intentionally include only the fields required by the project spec.
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timezone
-from typing import Any, Literal
+from typing import Any, Final, Literal
 
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator #type: ignore
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator, model_validator #type: ignore
 
 
 def _parse_rfc3339_datetime(value: Any) -> datetime | None:
@@ -19,21 +20,29 @@ def _parse_rfc3339_datetime(value: Any) -> datetime | None:
     if isinstance(value, datetime):
         dt = value
     else:
-        raw = str(value)
         # Kalshi uses RFC3339 timestamps like "2023-11-07T05:31:56Z".
-        if raw.endswith("Z"):
-            raw = raw[:-1] + "+00:00"
-        dt = datetime.fromisoformat(raw)
+        # fromisoformat() is a C-level parser and accepts the trailing "Z"
+        # directly on Python >= 3.11, so no string surgery is needed first.
+        dt = datetime.fromisoformat(str(value))
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt
 
 
+# Prices live on a 1-cent grid, so the same handful of 4-decimal strings
+# ("0.1500", ...) recur across every orderbook/market payload; a dict hit is
+# much cheaper than re-running the float string parser each time.
+_PRICE_CACHE: dict[str, float] = {f"{i / 100:.4f}": i / 100 for i in range(101)}
+
+
 def _parse_fixed_point_dollars(value: Any) -> float:
     """Parse a fixed-point dollars field from Kalshi (commonly a string)."""
     # API docs define dollars fields as fixed-point strings (4 decimals).
     if value is None or value == "":
         return 0.0
+    cached = _PRICE_CACHE.get(value) if type(value) is str else None
+    if cached is not None:
+        return cached
     return float(value)
 
 
@@ -125,12 +134,22 @@ class KalshiOrderBook(_Model):
         no_raw = orderbook.get("no_dollars") or []
 
         def _levels(raw: list[list[Any]]) -> list[KalshiPriceLevel]:
-            """Convert raw `[price, count]` arrays into validated price levels."""
+            """Convert raw `[price, count]` arrays into price levels.
+
+            Orderbook polling is the hottest parse path, so levels are built
+            with `model_construct` and explicit coercion rather than running
+            the full validator pipeline per `[price, count]` pair.
+            """
             levels: list[KalshiPriceLevel] = []
+            append = levels.append
             for item in raw:
                 if not item or len(item) < 2:
                     continue
-                levels.append(KalshiPriceLevel(dollars=item[0], count=item[1]))
+                append(
+                    KalshiPriceLevel.model_construct(
+                        dollars=_parse_fixed_point_dollars(item[0]), count=int(item[1])
+                    )
+                )
             return levels
 
         return cls(yes_dollars=_levels(yes_raw), no_dollars=_levels(no_raw))
@@ -179,11 +198,19 @@ class KalshiOrder(_Model):
     @classmethod
     def _populate_count_from_api(cls, data: Any) -> Any:
         """Map REST `initial_count` into our `count` field when missing."""
-        # REST responses contain `initial_count` (not `count`). We map it into our
-        # spec's `count` field if the caller didn't explicitly set count.
-        if isinstance(data, dict) and "count" not in data and "initial_count" in data:
-            data = dict(data)
-            data["count"] = data.get("initial_count")
+        if isinstance(data, dict):
+            # REST responses contain `initial_count` (not `count`). We map it into
+            # our spec's `count` field if the caller didn't explicitly set count.
+            if "count" not in data and "initial_count" in data:
+                data = dict(data)
+                data["count"] = data.get("initial_count")
+            # Intern the low-cardinality intent strings ("yes"/"no",
+            # "buy"/"sell", ...): JSON decoders allocate fresh strings, and
+            # interning makes every downstream == a pointer comparison.
+            for field in ("side", "action", "type", "status"):
+                value = data.get(field)
+                if type(value) is str:
+                    data[field] = sys.intern(value)
         return data
 
     @field_validator(
@@ -241,6 +268,14 @@ class KalshiPosition(_Model):
         return cls.model_validate(payload)
 
 
+# List adapters for paged endpoints: validating a whole page in one
+# pydantic-core call avoids re-entering Python per element the way a
+# `[Model.from_api(x) for x in ...]` comprehension does.
+MARKET_LIST_ADAPTER: Final = TypeAdapter(list[KalshiMarket])
+ORDER_LIST_ADAPTER: Final = TypeAdapter(list[KalshiOrder])
+POSITION_LIST_ADAPTER: Final = TypeAdapter(list[KalshiPosition])
+
+
 class KalshiBalance(_Model):
     """Account balance fields returned by the Kalshi REST API."""
 
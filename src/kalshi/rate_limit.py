@@ -12,18 +12,19 @@ import time
 
 
 class TokenBucketRateLimiter:
-    """A simple token-bucket rate limiter.
+    """A token-bucket rate limiter using virtual scheduling (GCRA).
 
     Spec:
     - rate = KALSHI_RATE_LIMIT
-    - capacity = rate
-    - token_count
-    - last_checked_time
-    - acquire():
-        - add (now - last_checked_time) * rate
-        - clamp to capacity
-        - if tokens >= 1: consume token and return
-        - else: sleep until 1 token would exist
+    - capacity = rate (a cold limiter allows a burst of `capacity` requests)
+    - acquire(): reserve the next emission slot and sleep exactly once until
+      it is due.
+
+    Equivalent to the classic refill-loop formulation, but each acquire()
+    computes its deadline up front instead of sleeping and re-checking, so a
+    waiter wakes once instead of ping-ponging with the scheduler. Because the
+    reservation (`_tat` update) happens synchronously before the sleep,
+    concurrent acquirers are served in call order.
     """
 
     def __init__(self, rate: int):
@@ -33,23 +34,27 @@ class TokenBucketRateLimiter:
 
         self.rate: float = float(rate)
         self.capacity: float = float(rate)
-        self.token_count: float = float(rate)
-        self.last_checked_time: float = time.monotonic()
-
-    async def acquire(self) -> None:
-        """Wait until at least one token is available, then consume it."""
-        while True:
-            now = time.monotonic()
-            elapsed = now - self.last_checked_time
-            self.last_checked_time = now
-
-            self.token_count = min(self.capacity, self.token_count + elapsed * self.rate)
-
-            if self.token_count >= 1.0:
-                self.token_count -= 1.0
-                return
-
-            # How long until token_count reaches 1.0?
-            deficit = 1.0 - self.token_count
-            sleep_seconds = max(0.0, deficit / self.rate)
-            await asyncio.sleep(sleep_seconds)
\ No newline at end of file
+        # Emission interval between conforming requests, the burst window a
+        # cold limiter may spend instantly, and the theoretical arrival time
+        # of the next request.
+        self._interval: float = 1.0 / self.rate
+        self._burst_tolerance: float = (self.capacity - 1.0) * self._interval
+        self._tat: float = time.monotonic()
+
+    async def acquire(self) -> float:
+        """Reserve the next emission slot, sleeping once until it is due.
+
+        Returns the `time.monotonic()` reading taken for the reservation so
+        callers on the request hot path can reuse it instead of re-reading
+        the clock.
+        """
+        now = time.monotonic()
+        tat = self._tat
+        if tat < now:
+            tat = now
+        self._tat = tat + self._interval
+
+        delay = tat - self._burst_tolerance - now
+        if delay > 0.0:
+            await asyncio.sleep(delay)
+        return now
\ No newline at end of file
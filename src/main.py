@@ -18,9 +18,20 @@ import os
 from pathlib import Path
 import time
 
-from config import load_config
+try:
+    import uvloop  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator (pip install .[speed])
+    uvloop = None  # type: ignore[assignment]
+
+from config import get_config
 from kalshi.client import KalshiClient
-from observability import DuckDBObservabilitySink, ObservabilityRecorder
+from observability import (
+    DuckDBObservabilitySink,
+    MultiObservabilitySink,
+    ObservabilityRecorder,
+    ObservabilitySink,
+    StdoutObservabilitySink,
+)
 from trading.bus import ExecutionCommandBus, ExecutionEventBus, MarketSnapshotBus, TradeIntentBus
 from trading.execution.adapters.kalshi import KalshiExecutionAdapter
 from trading.execution.engine import ExecutionEngine
@@ -31,37 +42,6 @@ from trading.resolvers import MarketResolver, WeatherResolver
 from trading.strategy import StrategyOrchestrator, StubStrategy
 
 
-async def _log_events(
-    execution_event_bus: ExecutionEventBus,
-    trade_intent_bus: TradeIntentBus,
-    market_snapshot_bus: MarketSnapshotBus,
-) -> None:
-    """Subscribe to all event buses and print messages from each."""
-
-    async def log_execution_events() -> None:
-        q = execution_event_bus.subscribe()
-        while True:
-            event = await q.get()
-            print(f"[execution_event] {event.type}: {event}")
-
-    async def log_trade_intents() -> None:
-        q = trade_intent_bus.subscribe()
-        while True:
-            intent = await q.get()
-            print(f"[trade_intent] {intent}")
-
-    async def log_market_snapshots() -> None:
-        q = market_snapshot_bus.subscribe()
-        while True:
-            snapshot = await q.get()
-            print(f"[market_snapshot] subject={snapshot.subject!r} implied_probability={snapshot.implied_probability} bid={snapshot.bid} ask={snapshot.ask} liquidity={snapshot.liquidity}")
-
-    await asyncio.gather(
-        log_execution_events(),
-        log_trade_intents(),
-        log_market_snapshots(),
-    )
-
 async def _stub_driven_loop(
     orchestrator: StrategyOrchestrator,
     interval_s: float,
@@ -78,14 +58,19 @@ async def run_demo() -> None:
     When RUN_STUB_STRATEGY=true (default): stub strategy emits intents on a timer;
     PM consumes intents and submits orders. When false: legacy manual buy/sell flow.
     """
-    cfg = load_config()
+    cfg = get_config()
 
     client = KalshiClient(cfg.kalshi)
     adapter = KalshiExecutionAdapter(client)
 
     repo_root = Path(__file__).resolve().parent.parent
     db_path = os.getenv("OBSERVABILITY_DB_PATH", str(repo_root / "observability.duckdb"))
-    recorder = ObservabilityRecorder(sink=DuckDBObservabilitySink(path=db_path))
+    # Console logging rides the recorder's writer thread instead of a
+    # dedicated event-bus subscriber, so stdout I/O stays off the event loop.
+    sink: ObservabilitySink = DuckDBObservabilitySink(path=db_path)
+    if os.getenv("DEMO_LOG_TO_STDOUT", "true") == "true":
+        sink = MultiObservabilitySink([sink, StdoutObservabilitySink()])
+    recorder = ObservabilityRecorder(sink=sink)
 
     execution_command_bus = ExecutionCommandBus(recorder=recorder)
     execution_event_bus = ExecutionEventBus(recorder=recorder)
@@ -133,61 +118,48 @@ async def run_demo() -> None:
         recorder=recorder,
     )
 
-    engine_task = asyncio.create_task(engine.run(), name="execution-engine")
-    pm_task = asyncio.create_task(pm.run(), name="portfolio-manager")
-    intent_task = asyncio.create_task(pm.run_intent_consumer(), name="intent-consumer")
-    log_task = asyncio.create_task(
-        _log_events(execution_event_bus, trade_intent_bus, market_snapshot_bus),
-        name="event-logger",
-    )
-    poller_task: asyncio.Task | None = None
-    snapshot_consumer_task: asyncio.Task | None = None
-
-    if os.getenv("RUN_STUB_STRATEGY", "true") == "true":
-        stub = StubStrategy(subject=stub_subject, date_offset_days=stub_date_offset_days)
-        orchestrator.register(stub)
-        all_subjects: set[str] = set()
-        for s in orchestrator._strategies:
-            all_subjects |= s.subjects
-        market_state_service.add_subjects(all_subjects)
-        poller_task = asyncio.create_task(
-            market_state_service.run_poller(market_state_poller_interval_s),
-            name="market-state-poller",
-        )
-        snapshot_consumer_task = asyncio.create_task(
-            orchestrator.run_snapshot_consumer(),
-            name="snapshot-consumer",
-        )
-        timer_task = asyncio.create_task(
-            _stub_driven_loop(orchestrator, stub_interval_s),
-            name="stub-timer",
-        )
-    else:
-        timer_task = None
-
     try:
-        tasks = [engine_task, pm_task, intent_task, log_task]
-        if timer_task is not None:
-            tasks.append(timer_task)
-        if poller_task is not None:
-            tasks.append(poller_task)
-        if snapshot_consumer_task is not None:
-            tasks.append(snapshot_consumer_task)
-        await asyncio.gather(*tasks)
+        # TaskGroup gives structured cancellation: if any task fails (or the
+        # demo is cancelled), the rest are cancelled as a unit instead of the
+        # old serial cancel-then-gather dance.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(engine.run(), name="execution-engine")
+            tg.create_task(pm.run(), name="portfolio-manager")
+            tg.create_task(pm.run_intent_consumer(), name="intent-consumer")
+
+            if os.getenv("RUN_STUB_STRATEGY", "true") == "true":
+                stub = StubStrategy(subject=stub_subject, date_offset_days=stub_date_offset_days)
+                orchestrator.register(stub)
+                all_subjects: set[str] = set()
+                for s in orchestrator._strategies:
+                    all_subjects |= s.subjects
+                market_state_service.add_subjects(all_subjects)
+                tg.create_task(
+                    market_state_service.run_poller(market_state_poller_interval_s),
+                    name="market-state-poller",
+                )
+                tg.create_task(
+                    orchestrator.run_snapshot_consumer(),
+                    name="snapshot-consumer",
+                )
+                tg.create_task(
+                    _stub_driven_loop(orchestrator, stub_interval_s),
+                    name="stub-timer",
+                )
     finally:
-        for t in [log_task, timer_task, intent_task, snapshot_consumer_task, poller_task, pm_task, engine_task]:
-            if t is not None:
-                t.cancel()
-        await asyncio.gather(
-            log_task, timer_task, intent_task, snapshot_consumer_task, poller_task, pm_task, engine_task,
-            return_exceptions=True,
-        )
         await recorder.aclose()
 
 
 def main() -> None:
-    """CLI entrypoint for running the demo with `python -m src.main` / `python src/main.py`."""
-    asyncio.run(run_demo())
+    """CLI entrypoint for running the demo with `python -m src.main` / `python src/main.py`.
+
+    Uses uvloop's libuv-based event loop when installed (the [speed] extra);
+    otherwise falls back to the default asyncio loop.
+    """
+    if uvloop is not None:
+        asyncio.run(run_demo(), loop_factory=uvloop.new_event_loop)
+    else:
+        asyncio.run(run_demo())
 
 if __name__ == "__main__":
     main()
@@ -10,12 +10,20 @@ It is intentionally small so the rest of the system can evolve without tight cou
 
 from .models import ObservabilityRecord
 from .recorder import ObservabilityRecorder
-from .sinks import DuckDBObservabilitySink, InMemoryObservabilitySink, ObservabilitySink
+from .sinks import (
+    DuckDBObservabilitySink,
+    InMemoryObservabilitySink,
+    MultiObservabilitySink,
+    ObservabilitySink,
+    StdoutObservabilitySink,
+)
 
 __all__ = [
     "DuckDBObservabilitySink",
     "InMemoryObservabilitySink",
+    "MultiObservabilitySink",
     "ObservabilityRecord",
     "ObservabilityRecorder",
     "ObservabilitySink",
+    "StdoutObservabilitySink",
 ]
@@ -14,9 +14,13 @@ from typing import Any, Literal
 from pydantic import BaseModel, ConfigDict, Field #type: ignore
 
 
+# Cached at module scope so utc_now skips the attribute lookup per call.
+_UTC = timezone.utc
+
+
 def utc_now() -> datetime:
     """Return the current UTC time as a timezone-aware datetime."""
-    return datetime.now(tz=timezone.utc)
+    return datetime.now(_UTC)
 
 
 RecordKind = Literal["command", "event", "error"]
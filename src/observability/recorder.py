@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+from collections import deque
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any, Literal
 
@@ -12,6 +15,10 @@ from .sinks import ObservabilitySink
 
 MessageKind = Literal["command", "event", "error"]
 
+# Upper bound on records written per sink call; keeps a burst from turning
+# into one enormous write while still amortizing per-write overhead.
+_MAX_WRITE_BATCH = 512
+
 
 def _safe_getattr(obj: Any, name: str) -> Any:
     """Best-effort getattr that never raises (defensive for observability)."""
@@ -52,12 +59,103 @@ def _extract_venue_order_id(message: Any) -> str | None:
     return None
 
 
-def _extract_occurred_at(message: Any) -> datetime:
-    """Extract a message timestamp, falling back to `utc_now()` when absent."""
-    ts = _safe_getattr(message, "ts")
-    if isinstance(ts, datetime):
-        return ts
-    return utc_now()
+# Per-class identifier plan: which of (type, trade_id, request, venue_order_id,
+# ts) the class declares. `()` marks non-pydantic classes that need the
+# defensive _safe_getattr path.
+_extract_plans: dict[type, tuple[bool, ...]] = {}
+
+
+def _extract_plan(cls: type) -> tuple[bool, ...]:
+    """Return (and cache) which identifier fields a message class declares."""
+    plan = _extract_plans.get(cls)
+    if plan is None:
+        fields = getattr(cls, "model_fields", None)
+        if fields is None:
+            plan = ()
+        else:
+            plan = (
+                "type" in fields,
+                "trade_id" in fields,
+                "request" in fields,
+                "venue_order_id" in fields,
+                "ts" in fields,
+            )
+        _extract_plans[cls] = plan
+    return plan
+
+
+def _extract_identifiers(message: Any) -> tuple[str, str | None, str | None, datetime | None]:
+    """Extract (event_type, trade_id, venue_order_id, occurred_at) in one pass.
+
+    Pydantic message classes read their declared attributes directly via the
+    cached per-class plan, skipping the per-record getattr/try-except chains;
+    unknown shapes keep the defensive path.
+    """
+    cls = type(message)
+    plan = _extract_plan(cls)
+    if not plan:
+        ts = _safe_getattr(message, "ts")
+        return (
+            _extract_event_type(message),
+            _extract_trade_id(message),
+            _extract_venue_order_id(message),
+            ts if isinstance(ts, datetime) else None,
+        )
+
+    has_type, has_trade_id, has_request, has_voi, has_ts = plan
+
+    event_type = cls.__name__
+    if has_type:
+        msg_type = message.type
+        if isinstance(msg_type, str) and msg_type:
+            event_type = msg_type
+
+    trade_id: str | None = message.trade_id if has_trade_id else None
+    if not (isinstance(trade_id, str) and trade_id):
+        trade_id = None
+        if has_request:
+            nested = getattr(message.request, "trade_id", None)
+            if isinstance(nested, str) and nested:
+                trade_id = nested
+
+    venue_order_id: str | None = message.venue_order_id if has_voi else None
+    if not (isinstance(venue_order_id, str) and venue_order_id):
+        venue_order_id = None
+
+    ts = message.ts if has_ts else None
+    return (event_type, trade_id, venue_order_id, ts if isinstance(ts, datetime) else None)
+
+
+_SECRET_KEYS = ("api_key", "private_key", "secret", "token", "password")
+
+# Request fields worth keeping in summaries (full payloads are dropped).
+_REQUEST_FIELDS = (
+    "trade_id",
+    "venue",
+    "ticker",
+    "side",
+    "action",
+    "count",
+    "order_type",
+    "limit_price_dollars",
+    "client_order_id",
+)
+_REQUEST_INCLUDE = frozenset(_REQUEST_FIELDS)
+
+# Per-class summary plan: (declares secret-like fields, declares `request`).
+# Message classes flowing through the buses are a small fixed set, so the
+# field inspection runs once per class instead of per record.
+_summary_plans: dict[type, tuple[bool, bool]] = {}
+
+
+def _summary_plan(cls: type) -> tuple[bool, bool]:
+    """Return (and cache) the summary-handling plan for a message class."""
+    plan = _summary_plans.get(cls)
+    if plan is None:
+        fields = getattr(cls, "model_fields", {})
+        plan = (any(k in fields for k in _SECRET_KEYS), "request" in fields)
+        _summary_plans[cls] = plan
+    return plan
 
 
 def _extract_summary(message: Any) -> dict[str, Any]:
@@ -66,45 +164,45 @@ def _extract_summary(message: Any) -> dict[str, Any]:
     This intentionally avoids storing full raw payloads. It also performs a
     heuristic redaction pass for obvious secret-like fields.
     """
-    # Prefer a Pydantic dump when available. Keep it small and stable:
-    # - avoid full raw payloads by default
-    # - allow adding more fields per event type later
     if hasattr(message, "model_dump"):
-        data = message.model_dump()
-    elif isinstance(message, dict):
-        data = dict(message)
-    else:
-        data = {"repr": repr(message)}
-
-    # Heuristic redaction: never store obvious secret-like fields.
-    for key in ["api_key", "private_key", "secret", "token", "password"]:
+        has_secrets, has_request = _summary_plan(type(message))
+        if has_request:
+            # Exclude the nested request from the dump (so it is never fully
+            # materialized) and pull only the selected fields from it.
+            data = message.model_dump(exclude=_REQUEST_EXCLUDE)
+            request = _safe_getattr(message, "request")
+            if hasattr(request, "model_dump"):
+                selected = request.model_dump(include=_REQUEST_INCLUDE)
+            elif isinstance(request, dict):
+                selected = {k: request[k] for k in _REQUEST_FIELDS if k in request}
+            else:
+                selected = {}
+            if selected:
+                data["request"] = selected
+        else:
+            data = message.model_dump()
+        if has_secrets:
+            for key in _SECRET_KEYS:
+                if key in data:
+                    data[key] = "[REDACTED]"
+        return data
+
+    # Unknown shapes keep the fully defensive path.
+    data = dict(message) if isinstance(message, dict) else {"repr": repr(message)}
+    for key in _SECRET_KEYS:
         if key in data:
             data[key] = "[REDACTED]"
-
-    # Drop nested request payloads by default; keep selected request fields if present.
     request = data.pop("request", None)
     if isinstance(request, dict):
-        selected = {
-            k: request.get(k)
-            for k in [
-                "trade_id",
-                "venue",
-                "ticker",
-                "side",
-                "action",
-                "count",
-                "order_type",
-                "limit_price_dollars",
-                "client_order_id",
-            ]
-            if k in request
-        }
+        selected = {k: request[k] for k in _REQUEST_FIELDS if k in request}
         if selected:
             data["request"] = selected
-
     return data
 
 
+_REQUEST_EXCLUDE = frozenset({"request"})
+
+
 class ObservabilityRecorder:
     """Queues records and writes them in a background task."""
 
@@ -117,8 +215,16 @@ class ObservabilityRecorder:
                 when full to avoid blocking trading.
         """
         self._sink = sink
-        self._queue: asyncio.Queue[ObservabilityRecord | None] = asyncio.Queue(maxsize=max_queue_size)
-        self._worker: asyncio.Task[None] | None = None
+        self._max_queue_size = max_queue_size
+        # Records flow to a dedicated writer thread through a bounded deque:
+        # producers on the event loop pay one C-level append (deque eviction
+        # gives drop-oldest on overload, no exception path), and the Event
+        # wakes the thread without any future machinery. Appends and the
+        # drain's popleft are both atomic under the GIL.
+        self._buffer: deque[ObservabilityRecord] = deque(maxlen=max_queue_size)
+        self._has_items = threading.Event()
+        self._stop = threading.Event()
+        self._writer_thread: threading.Thread | None = None
         self._closed = False
 
         # Degradation tracking (MVP): counts and time window.
@@ -127,12 +233,15 @@ class ObservabilityRecorder:
         self._last_failure_at: datetime | None = None
 
     def _ensure_started(self) -> None:
-        """Start the background writer task if it hasn't been started yet."""
-        if self._worker is not None:
+        """Start the background writer thread if it hasn't been started yet."""
+        if self._writer_thread is not None:
             return
-        self._worker = asyncio.create_task(self._run_worker(), name="observability-writer")
+        self._writer_thread = threading.Thread(
+            target=self._thread_loop, name="observability-writer", daemon=True
+        )
+        self._writer_thread.start()
 
-    async def record_message(
+    def record_message(
         self,
         message: Any,
         *,
@@ -146,31 +255,67 @@ class ObservabilityRecorder:
 
         self._ensure_started()
 
-        trade_id = _extract_trade_id(message)
-        venue_order_id = _extract_venue_order_id(message)
-        corr = correlation_id or trade_id or venue_order_id
+        # One clock sample per record, shared by the occurred_at fallback and
+        # logged_at.
+        self._enqueue(self._build_record(message, kind, stage, correlation_id, utc_now()))
+        self._has_items.set()
 
-        record = ObservabilityRecord(
+    def record_messages(
+        self,
+        messages: Iterable[Any],
+        *,
+        kind: MessageKind,
+        stage: str,
+    ) -> None:
+        """Record a batch of messages with one clock sample and one wakeup."""
+        if self._closed:
+            return
+
+        self._ensure_started()
+
+        now = utc_now()
+        for message in messages:
+            self._enqueue(self._build_record(message, kind, stage, None, now))
+        self._has_items.set()
+
+    def _build_record(
+        self,
+        message: Any,
+        kind: MessageKind,
+        stage: str,
+        correlation_id: str | None,
+        now: datetime,
+    ) -> ObservabilityRecord:
+        """Build an ObservabilityRecord for a message (shared single/batch path)."""
+        event_type, trade_id, venue_order_id, occurred_at = _extract_identifiers(message)
+
+        # model_construct skips validation: every field below is produced
+        # in-process with the right type, so there is nothing to coerce.
+        return ObservabilityRecord.model_construct(
             kind=kind,
-            event_type=_extract_event_type(message),
+            event_type=event_type,
             stage=stage,
-            correlation_id=corr,
+            correlation_id=correlation_id or trade_id or venue_order_id,
             trade_id=trade_id,
             venue_order_id=venue_order_id,
-            occurred_at=_extract_occurred_at(message),
-            logged_at=utc_now(),
+            occurred_at=occurred_at if occurred_at is not None else now,
+            logged_at=now,
             summary=_extract_summary(message),
         )
 
-        # In overload conditions we prefer dropping records over blocking trading.
-        try:
-            self._queue.put_nowait(record)
-        except asyncio.QueueFull:
-            # Track as a "write failure" window for degraded observability.
+    def _enqueue(self, record: ObservabilityRecord) -> None:
+        """Append a record to the writer buffer, tracking drop-oldest evictions.
+
+        In overload conditions we prefer dropping records over blocking
+        trading: a full deque evicts the oldest record on append. Count the
+        eviction as a "write failure" window for degraded observability.
+        """
+        if len(self._buffer) >= self._max_queue_size:
             now = utc_now()
             self._write_failures += 1
             self._first_failure_at = self._first_failure_at or now
             self._last_failure_at = now
+        self._buffer.append(record)
 
     async def aclose(self) -> None:
         """Flush and close the recorder.
@@ -180,26 +325,44 @@ class ObservabilityRecorder:
         if self._closed:
             return
         self._closed = True
-        if self._worker is not None:
-            await self._queue.put(None)
-            await self._worker
+        if self._writer_thread is not None:
+            self._stop.set()
+            self._has_items.set()
+            await asyncio.to_thread(self._writer_thread.join)
         await asyncio.to_thread(self._sink.close)
 
-    async def _run_worker(self) -> None:
-        """Background loop that drains the queue and writes to the sink."""
+    def _thread_loop(self) -> None:
+        """Writer-thread loop: drain the buffer in batches and write to the sink.
+
+        Draining whatever is immediately available (up to `_MAX_WRITE_BATCH`)
+        amortizes the per-write sink overhead across event bursts; a quiet
+        buffer still writes each record as it arrives.
+        """
+        buf = self._buffer
         while True:
-            item = await self._queue.get()
-            try:
-                if item is None:
-                    return
-                await asyncio.to_thread(self._sink.write, item)
-            except Exception:  # noqa: BLE001 - observability must not crash trading
-                now = utc_now()
-                self._write_failures += 1
-                self._first_failure_at = self._first_failure_at or now
-                self._last_failure_at = now
-            finally:
-                self._queue.task_done()
+            self._has_items.wait()
+            # Clear before draining: a producer that appends mid-drain re-sets
+            # the event, so a wakeup is never lost.
+            self._has_items.clear()
+
+            while buf:
+                batch: list[ObservabilityRecord] = []
+                while buf and len(batch) < _MAX_WRITE_BATCH:
+                    try:
+                        batch.append(buf.popleft())
+                    except IndexError:  # pragma: no cover - raced an eviction
+                        break
+                try:
+                    if batch:
+                        self._sink.write_many(batch)
+                except Exception:  # noqa: BLE001 - observability must not crash trading
+                    now = utc_now()
+                    self._write_failures += len(batch)
+                    self._first_failure_at = self._first_failure_at or now
+                    self._last_failure_at = now
+
+            if self._stop.is_set() and not buf:
+                return
 
     def degraded_status(self) -> dict[str, Any]:
         """Return a minimal degraded-status snapshot."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import sys
 import threading
 from collections.abc import Sequence
 from dataclasses import dataclass
@@ -11,9 +12,21 @@ from typing import Protocol
 
 import duckdb #type: ignore
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator (pip install .[speed])
+    orjson = None  # type: ignore[assignment]
+
 from .models import ObservabilityRecord
 
 
+def _dumps_summary(summary: dict) -> str:
+    """Serialize a record summary to compact JSON text, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(summary, default=str).decode("utf-8")
+    return json.dumps(summary, separators=(",", ":"), default=str)
+
+
 class ObservabilitySink(Protocol):
     """A synchronous sink for observability records.
 
@@ -24,12 +37,20 @@ class ObservabilitySink(Protocol):
     def write(self, record: ObservabilityRecord) -> None:
         """Persist a single record."""
 
+    def write_many(self, records: Sequence[ObservabilityRecord]) -> None:
+        """Persist a batch of records in one call."""
+
     def close(self) -> None:
         """Close any underlying resources."""
 
 
 class InMemoryObservabilitySink:
-    """In-memory sink for tests and local debugging."""
+    """In-memory sink for tests and local debugging.
+
+    The record list is append-only, so readers never need the writer lock:
+    a concurrent append can at most land after snapshot() captured its
+    length, which is an ordinary point-in-time race, not corruption.
+    """
 
     def __init__(self) -> None:
         """Create an empty in-memory sink."""
@@ -41,13 +62,67 @@ class InMemoryObservabilitySink:
         with self._lock:
             self._records.append(record)
 
+    def write_many(self, records: Sequence[ObservabilityRecord]) -> None:
+        """Append a batch of records to the in-memory list (thread-safe)."""
+        with self._lock:
+            self._records.extend(records)
+
     def close(self) -> None:  # noqa: D401 - keep interface consistent
         """No-op."""
 
     def snapshot(self) -> Sequence[ObservabilityRecord]:
-        """Return a point-in-time copy of all recorded entries."""
-        with self._lock:
-            return list(self._records)
+        """Return a point-in-time copy of all recorded entries (lock-free)."""
+        return tuple(self._records)
+
+
+class StdoutObservabilitySink:
+    """Sink that prints records as single lines to stdout.
+
+    Intended to replace ad-hoc event-bus print loops: it runs on the
+    recorder's writer thread, so stdout I/O never blocks the event loop.
+    """
+
+    @staticmethod
+    def _format(record: ObservabilityRecord) -> str:
+        return (
+            f"[{record.stage}] {record.kind}/{record.event_type}"
+            f" correlation_id={record.correlation_id} summary={record.summary}\n"
+        )
+
+    def write(self, record: ObservabilityRecord) -> None:
+        """Write a single formatted line to stdout."""
+        sys.stdout.write(self._format(record))
+
+    def write_many(self, records: Sequence[ObservabilityRecord]) -> None:
+        """Write a batch of records to stdout with one syscall-ish write."""
+        sys.stdout.write("".join(self._format(r) for r in records))
+
+    def close(self) -> None:
+        """Flush stdout (the stream itself is not ours to close)."""
+        sys.stdout.flush()
+
+
+class MultiObservabilitySink:
+    """Sink that fans each write out to several underlying sinks in order."""
+
+    def __init__(self, sinks: Sequence[ObservabilitySink]) -> None:
+        """Create a fan-out sink over the given sinks."""
+        self._sinks = tuple(sinks)
+
+    def write(self, record: ObservabilityRecord) -> None:
+        """Write the record to every underlying sink."""
+        for sink in self._sinks:
+            sink.write(record)
+
+    def write_many(self, records: Sequence[ObservabilityRecord]) -> None:
+        """Write the batch to every underlying sink."""
+        for sink in self._sinks:
+            sink.write_many(records)
+
+    def close(self) -> None:
+        """Close every underlying sink."""
+        for sink in self._sinks:
+            sink.close()
 
 
 @dataclass(frozen=True)
@@ -60,14 +135,28 @@ class DuckDBObservabilitySink:
     """DuckDB sink for durable local persistence.
 
     This is intended as a lightweight, embedded store for early-stage observability.
+
+    The sink is single-writer by design: the recorder drives all writes from
+    its dedicated writer thread (DuckDB connections are not safely sharable
+    across threads anyway), so writes take no lock. The first writing thread
+    claims the connection and concurrent use from another thread is an error.
+    `close` is safe after the writer thread has exited, which is the order
+    `ObservabilityRecorder.aclose` guarantees.
     """
 
     def __init__(self, *, path: str | Path, table: str = "observability_records") -> None:
         """Create (or open) a DuckDB-backed sink at the given path."""
         self._opts = DuckDBOptions(path=Path(path), table=table)
-        self._lock = threading.Lock()
+        self._writer_ident: int | None = None
         self._conn = duckdb.connect(str(self._opts.path))
         self._ensure_schema()
+        # The insert statement only depends on the table name; build it once
+        # instead of re-interpolating the f-string per write call.
+        self._insert_sql = f"""
+        insert into {self._opts.table}
+        (logged_at, occurred_at, kind, event_type, stage, correlation_id, trade_id, venue_order_id, summary_json)
+        values (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
 
     def _ensure_schema(self) -> None:
         """Create the backing table if it does not exist yet."""
@@ -85,38 +174,66 @@ class DuckDBObservabilitySink:
           summary_json varchar not null
         )
         """
-        with self._lock:
-            self._conn.execute(create_sql)
+        self._conn.execute(create_sql)
+
+    def _check_writer(self) -> None:
+        """Verify writes stay on the thread that first wrote (single-writer confinement)."""
+        ident = threading.get_ident()
+        if self._writer_ident is None:
+            self._writer_ident = ident
+        elif ident != self._writer_ident:
+            raise RuntimeError("DuckDBObservabilitySink must be driven by a single writer thread")
 
     def write(self, record: ObservabilityRecord) -> None:
         """Insert a single record into DuckDB.
 
-        Note: the sink stores the record summary as stable JSON.
-        """
-        summary_json = json.dumps(record.summary, separators=(",", ":"), sort_keys=True, default=str)
-        insert_sql = f"""
-        insert into {self._opts.table}
-        (logged_at, occurred_at, kind, event_type, stage, correlation_id, trade_id, venue_order_id, summary_json)
-        values (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        Note: the summary is stored as compact JSON. Key order follows the
+        record's dict order (insertion order is already deterministic per
+        message type, so sorting would only add per-record CPU).
         """
-        with self._lock:
-            self._conn.execute(
-                insert_sql,
-                [
-                    record.logged_at,
-                    record.occurred_at,
-                    record.kind,
-                    record.event_type,
-                    record.stage,
-                    record.correlation_id,
-                    record.trade_id,
-                    record.venue_order_id,
-                    summary_json,
-                ],
+        self._check_writer()
+        summary_json = _dumps_summary(record.summary)
+        self._conn.execute(
+            self._insert_sql,
+            [
+                record.logged_at,
+                record.occurred_at,
+                record.kind,
+                record.event_type,
+                record.stage,
+                record.correlation_id,
+                record.trade_id,
+                record.venue_order_id,
+                summary_json,
+            ],
+        )
+
+    def write_many(self, records: Sequence[ObservabilityRecord]) -> None:
+        """Insert a batch of records into DuckDB with one executemany call."""
+        if not records:
+            return
+        self._check_writer()
+        rows = [
+            (
+                r.logged_at,
+                r.occurred_at,
+                r.kind,
+                r.event_type,
+                r.stage,
+                r.correlation_id,
+                r.trade_id,
+                r.venue_order_id,
+                _dumps_summary(r.summary),
             )
+            for r in records
+        ]
+        self._conn.executemany(self._insert_sql, rows)
 
     def close(self) -> None:
-        """Close the underlying DuckDB connection."""
-        with self._lock:
-            self._conn.close()
+        """Close the underlying DuckDB connection.
+
+        Called after the writer thread has exited (see class docstring), so no
+        write can race the close.
+        """
+        self._conn.close()
 
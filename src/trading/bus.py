@@ -20,11 +20,30 @@ Planned buses (same naming pattern):
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from typing import Any, Literal
 
 from .models import ExecutionCommand, ExecutionEvent, MarketSnapshot, TradeIntent
 from observability.recorder import ObservabilityRecorder
 
+# Default bound for subscriber queues: deep enough that only a wedged consumer
+# ever hits it, at which point dropping beats blocking the publisher.
+_SUBSCRIBER_QUEUE_MAXSIZE = 4096
+
+# Overflow policy for a full subscriber queue: drop the incoming message
+# (default) or evict the oldest queued one to make room. There is no "block"
+# policy — publish is deliberately awaitless.
+OverflowPolicy = Literal["drop_newest", "drop_oldest"]
+
+
+def _evict_oldest(q: asyncio.Queue, item: Any) -> None:
+    """Make room in a full queue by evicting its oldest entry, then retry."""
+    try:
+        q.get_nowait()
+        q.put_nowait(item)
+    except (asyncio.QueueEmpty, asyncio.QueueFull):  # pragma: no cover - raced the consumer
+        pass
+
 
 class ExecutionCommandBus:
     """Single-consumer queue for execution commands (PortfolioManager -> ExecutionEngine).
@@ -36,14 +55,17 @@ class ExecutionCommandBus:
         """Create a command queue with optional observability recording."""
         self._queue: asyncio.Queue[ExecutionCommand] = asyncio.Queue()
         self._recorder = recorder
+        # Resolve the recorder branch once at construction instead of on
+        # every put: `put` is a bound-method alias for the right variant.
+        self.put = self._put_recorded if recorder is not None else self._put_unrecorded
 
-    async def put(self, cmd: ExecutionCommand, *, stage: str = "execution_command_bus") -> None:
-        """Enqueue a command for the execution engine.
+    async def _put_recorded(self, cmd: ExecutionCommand, *, stage: str = "execution_command_bus") -> None:
+        """Enqueue a command for the execution engine, recording it for observability."""
+        self._recorder.record_message(cmd, kind="command", stage=stage)
+        await self._queue.put(cmd)
 
-        If a recorder is configured, the command is also recorded for observability.
-        """
-        if self._recorder is not None:
-            await self._recorder.record_message(cmd, kind="command", stage=stage)
+    async def _put_unrecorded(self, cmd: ExecutionCommand, *, stage: str = "execution_command_bus") -> None:
+        """Enqueue a command for the execution engine (no recorder configured)."""
         await self._queue.put(cmd)
 
     async def get(self) -> ExecutionCommand:
@@ -65,28 +87,113 @@ class ExecutionEventBus:
         """Create an event fan-out bus with optional observability recording."""
         self._subscribers: set[asyncio.Queue[ExecutionEvent]] = set()
         self._recorder = recorder
-
-    def subscribe(self) -> asyncio.Queue[ExecutionEvent]:
-        """Create a new subscriber queue that will receive published events."""
-        q: asyncio.Queue[ExecutionEvent] = asyncio.Queue()
+        self._dropped = 0
+        # One-shot predicate waiters (wait_for): resolved inline on the first
+        # matching publish, so a caller waiting for one specific event doesn't
+        # need a queue subscription that buffers everything else.
+        self._waiters: list[tuple[Callable[[ExecutionEvent], bool], asyncio.Future[ExecutionEvent]]] = []
+        # Subscriber queues opted into drop-oldest overflow handling.
+        self._drop_oldest: set[asyncio.Queue] = set()
+        # Copy-on-write snapshot: publish iterates this tuple with zero
+        # allocation; it is rebuilt only when the subscriber set changes.
+        self._subs_snapshot: tuple[asyncio.Queue, ...] = ()
+        # Resolve the recorder branch once at construction instead of on
+        # every publish: `publish` aliases the right variant.
+        self.publish = self._publish_recorded if recorder is not None else self._publish_unrecorded
+
+    def subscribe(
+        self, *, maxsize: int = _SUBSCRIBER_QUEUE_MAXSIZE, policy: OverflowPolicy = "drop_newest"
+    ) -> asyncio.Queue[ExecutionEvent]:
+        """Create a new (bounded) subscriber queue that will receive published events."""
+        q: asyncio.Queue[ExecutionEvent] = asyncio.Queue(maxsize=maxsize)
         self._subscribers.add(q)
+        if policy == "drop_oldest":
+            self._drop_oldest.add(q)
+        self._subs_snapshot = tuple(self._subscribers)
         return q
 
     def unsubscribe(self, q: asyncio.Queue[ExecutionEvent]) -> None:
         """Remove a subscriber queue (no further events will be delivered)."""
         self._subscribers.discard(q)
+        self._drop_oldest.discard(q)
+        self._subs_snapshot = tuple(self._subscribers)
 
-    async def publish(self, event: ExecutionEvent, *, stage: str = "execution_event_bus") -> None:
-        """Publish an event to all current subscribers (best-effort fan-out)."""
-        if self._recorder is not None:
-            await self._recorder.record_message(event, kind="event", stage=stage)
-        for q in list(self._subscribers):
-            await q.put(event)
+    def wait_for(self, predicate: Callable[[ExecutionEvent], bool]) -> asyncio.Future[ExecutionEvent]:
+        """Return a future resolved with the first subsequently published event matching `predicate`.
+
+        One-shot: the waiter is removed once resolved (or once its future is
+        cancelled). Unlike subscribe(), nothing is buffered for the caller —
+        non-matching events cost one predicate call each.
+        """
+        fut: asyncio.Future[ExecutionEvent] = asyncio.get_running_loop().create_future()
+        self._waiters.append((predicate, fut))
+        return fut
+
+    def _resolve_waiters(self, event: ExecutionEvent) -> None:
+        """Resolve pending wait_for futures that match `event`."""
+        remaining = []
+        for predicate, fut in self._waiters:
+            if fut.done():
+                continue
+            if predicate(event):
+                fut.set_result(event)
+            else:
+                remaining.append((predicate, fut))
+        self._waiters = remaining
+
+    async def _publish_recorded(self, event: ExecutionEvent, *, stage: str = "execution_event_bus") -> None:
+        """Publish an event to all current subscribers, recording it first.
+
+        Delivery uses `put_nowait` on bounded queues: the publisher never
+        blocks behind a slow subscriber, and a full queue drops the event for
+        that subscriber only.
+        """
+        self._recorder.record_message(event, kind="event", stage=stage)
+        if self._waiters:
+            self._resolve_waiters(event)
+        for q in self._subs_snapshot:
+            try:
+                q.put_nowait(event)
+            except asyncio.QueueFull:
+                if q in self._drop_oldest:
+                    _evict_oldest(q, event)
+                self._dropped += 1
+
+    async def _publish_unrecorded(self, event: ExecutionEvent, *, stage: str = "execution_event_bus") -> None:
+        """Publish an event to all current subscribers (no recorder configured)."""
+        if self._waiters:
+            self._resolve_waiters(event)
+        for q in self._subs_snapshot:
+            try:
+                q.put_nowait(event)
+            except asyncio.QueueFull:
+                if q in self._drop_oldest:
+                    _evict_oldest(q, event)
+                self._dropped += 1
 
     async def publish_many(self, events: Iterable[ExecutionEvent], *, stage: str = "execution_event_bus") -> None:
-        """Publish multiple events sequentially, preserving order."""
-        for event in events:
-            await self.publish(event, stage=stage)
+        """Publish multiple events in order, recording the batch in one call.
+
+        The whole fan-out runs in a single coroutine step: one bulk recorder
+        call for the batch, then per-subscriber put_nowait loops with no
+        intermediate awaits.
+        """
+        batch = list(events)
+        if not batch:
+            return
+        if self._recorder is not None:
+            self._recorder.record_messages(batch, kind="event", stage=stage)
+        if self._waiters:
+            for event in batch:
+                self._resolve_waiters(event)
+        for q in self._subs_snapshot:
+            for event in batch:
+                try:
+                    q.put_nowait(event)
+                except asyncio.QueueFull:
+                    if q in self._drop_oldest:
+                        _evict_oldest(q, event)
+                    self._dropped += 1
 
 
 class TradeIntentBus:
@@ -99,23 +206,53 @@ class TradeIntentBus:
         """Create an intent fan-out bus with optional observability recording."""
         self._subscribers: set[asyncio.Queue[TradeIntent]] = set()
         self._recorder = recorder
-
-    def subscribe(self) -> asyncio.Queue[TradeIntent]:
-        """Create a new subscriber queue that will receive published intents."""
-        q: asyncio.Queue[TradeIntent] = asyncio.Queue()
+        self._dropped = 0
+        # Subscriber queues opted into drop-oldest overflow handling.
+        self._drop_oldest: set[asyncio.Queue] = set()
+        # Copy-on-write snapshot: publish iterates this tuple with zero
+        # allocation; it is rebuilt only when the subscriber set changes.
+        self._subs_snapshot: tuple[asyncio.Queue, ...] = ()
+        # Resolve the recorder branch once at construction instead of on
+        # every publish: `publish` aliases the right variant.
+        self.publish = self._publish_recorded if recorder is not None else self._publish_unrecorded
+
+    def subscribe(
+        self, *, maxsize: int = _SUBSCRIBER_QUEUE_MAXSIZE, policy: OverflowPolicy = "drop_newest"
+    ) -> asyncio.Queue[TradeIntent]:
+        """Create a new (bounded) subscriber queue that will receive published intents."""
+        q: asyncio.Queue[TradeIntent] = asyncio.Queue(maxsize=maxsize)
         self._subscribers.add(q)
+        if policy == "drop_oldest":
+            self._drop_oldest.add(q)
+        self._subs_snapshot = tuple(self._subscribers)
         return q
 
     def unsubscribe(self, q: asyncio.Queue[TradeIntent]) -> None:
         """Remove a subscriber queue (no further intents will be delivered)."""
         self._subscribers.discard(q)
-
-    async def publish(self, intent: TradeIntent, *, stage: str = "trade_intent_bus") -> None:
-        """Publish an intent to all current subscribers (best-effort fan-out)."""
-        if self._recorder is not None:
-            await self._recorder.record_message(intent, kind="event", stage=stage)
-        for queue in list(self._subscribers):
-            await queue.put(intent)
+        self._drop_oldest.discard(q)
+        self._subs_snapshot = tuple(self._subscribers)
+
+    async def _publish_recorded(self, intent: TradeIntent, *, stage: str = "trade_intent_bus") -> None:
+        """Publish an intent to all current subscribers, recording it first."""
+        self._recorder.record_message(intent, kind="event", stage=stage)
+        for queue in self._subs_snapshot:
+            try:
+                queue.put_nowait(intent)
+            except asyncio.QueueFull:
+                if queue in self._drop_oldest:
+                    _evict_oldest(queue, intent)
+                self._dropped += 1
+
+    async def _publish_unrecorded(self, intent: TradeIntent, *, stage: str = "trade_intent_bus") -> None:
+        """Publish an intent to all current subscribers (no recorder configured)."""
+        for queue in self._subs_snapshot:
+            try:
+                queue.put_nowait(intent)
+            except asyncio.QueueFull:
+                if queue in self._drop_oldest:
+                    _evict_oldest(queue, intent)
+                self._dropped += 1
 
 
 class MarketSnapshotBus:
@@ -128,20 +265,50 @@ class MarketSnapshotBus:
         """Create a snapshot fan-out bus with optional observability recording."""
         self._subscribers: set[asyncio.Queue[MarketSnapshot]] = set()
         self._recorder = recorder
-
-    def subscribe(self) -> asyncio.Queue[MarketSnapshot]:
-        """Create a new subscriber queue that will receive published snapshots."""
-        q: asyncio.Queue[MarketSnapshot] = asyncio.Queue()
+        self._dropped = 0
+        # Subscriber queues opted into drop-oldest overflow handling.
+        self._drop_oldest: set[asyncio.Queue] = set()
+        # Copy-on-write snapshot: publish iterates this tuple with zero
+        # allocation; it is rebuilt only when the subscriber set changes.
+        self._subs_snapshot: tuple[asyncio.Queue, ...] = ()
+        # Resolve the recorder branch once at construction instead of on
+        # every publish: `publish` aliases the right variant.
+        self.publish = self._publish_recorded if recorder is not None else self._publish_unrecorded
+
+    def subscribe(
+        self, *, maxsize: int = _SUBSCRIBER_QUEUE_MAXSIZE, policy: OverflowPolicy = "drop_newest"
+    ) -> asyncio.Queue[MarketSnapshot]:
+        """Create a new (bounded) subscriber queue that will receive published snapshots."""
+        q: asyncio.Queue[MarketSnapshot] = asyncio.Queue(maxsize=maxsize)
         self._subscribers.add(q)
+        if policy == "drop_oldest":
+            self._drop_oldest.add(q)
+        self._subs_snapshot = tuple(self._subscribers)
         return q
 
     def unsubscribe(self, q: asyncio.Queue[MarketSnapshot]) -> None:
         """Remove a subscriber queue (no further snapshots will be delivered)."""
         self._subscribers.discard(q)
-
-    async def publish(self, snapshot: MarketSnapshot, *, stage: str = "market_snapshot_bus") -> None:
-        """Publish a snapshot to all current subscribers (best-effort fan-out)."""
-        if self._recorder is not None:
-            await self._recorder.record_message(snapshot, kind="event", stage=stage)
-        for queue in list(self._subscribers):
-            await queue.put(snapshot)
+        self._drop_oldest.discard(q)
+        self._subs_snapshot = tuple(self._subscribers)
+
+    async def _publish_recorded(self, snapshot: MarketSnapshot, *, stage: str = "market_snapshot_bus") -> None:
+        """Publish a snapshot to all current subscribers, recording it first."""
+        self._recorder.record_message(snapshot, kind="event", stage=stage)
+        for queue in self._subs_snapshot:
+            try:
+                queue.put_nowait(snapshot)
+            except asyncio.QueueFull:
+                if queue in self._drop_oldest:
+                    _evict_oldest(queue, snapshot)
+                self._dropped += 1
+
+    async def _publish_unrecorded(self, snapshot: MarketSnapshot, *, stage: str = "market_snapshot_bus") -> None:
+        """Publish a snapshot to all current subscribers (no recorder configured)."""
+        for queue in self._subs_snapshot:
+            try:
+                queue.put_nowait(snapshot)
+            except asyncio.QueueFull:
+                if queue in self._drop_oldest:
+                    _evict_oldest(queue, snapshot)
+                self._dropped += 1
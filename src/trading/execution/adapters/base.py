@@ -6,6 +6,7 @@ can be swapped without changing engine/portfolio code.
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from typing import Protocol
 
 from ...models import OrderRequest, PositionSnapshot, TickerMarketSnapshot, VenueOrderId
@@ -21,6 +22,11 @@ class ExecutionAdapter(Protocol):
     async def get_order_status(self, venue_order_id: VenueOrderId) -> tuple[str, int]:
         """Return `(status, fill_count)` for an order."""
 
+    async def get_orders_status(
+        self, venue_order_ids: Sequence[VenueOrderId]
+    ) -> Mapping[VenueOrderId, tuple[str, int]]:
+        """Return `(status, fill_count)` for many orders, batched where the venue allows."""
+
     async def get_positions_snapshot(self) -> PositionSnapshot:
         """Return a normalized position snapshot."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
 
 from ...models import (
@@ -30,22 +31,22 @@ class KalshiExecutionAdapter(ExecutionAdapter):
 
     async def place_order(self, request: OrderRequest) -> VenueOrderId:
         """Place a normalized `OrderRequest` as a Kalshi order and return order id."""
-        order = KalshiOrder(
-            ticker=request.ticker,
-            side=request.side,
-            action=request.action,
-            type=request.order_type,
-            count=request.count,
-            client_order_id=request.client_order_id,
-        )
-
+        # Build the kwargs up front so the order is constructed (and validated)
+        # exactly once, instead of construct + model_copy for limit prices.
+        kwargs: dict[str, object] = {
+            "ticker": request.ticker,
+            "side": request.side,
+            "action": request.action,
+            "type": request.order_type,
+            "count": request.count,
+            "client_order_id": request.client_order_id,
+        }
         if request.order_type == "limit":
             if request.limit_price_dollars is None:
                 raise ValueError("limit orders require request.limit_price_dollars")
-            if request.side == "yes":
-                order = order.model_copy(update={"yes_price_dollars": request.limit_price_dollars})
-            else:
-                order = order.model_copy(update={"no_price_dollars": request.limit_price_dollars})
+            price_field = "yes_price_dollars" if request.side == "yes" else "no_price_dollars"
+            kwargs[price_field] = request.limit_price_dollars
+        order = KalshiOrder(**kwargs)
 
         created = await self._client.create_order(order)
         if not created.order_id:
@@ -63,11 +64,40 @@ class KalshiExecutionAdapter(ExecutionAdapter):
         fill_count = int(o.fill_count or 0)
         return status, fill_count
 
+    async def get_orders_status(
+        self, venue_order_ids: Sequence[VenueOrderId]
+    ) -> Mapping[VenueOrderId, tuple[str, int]]:
+        """Return `(status, fill_count)` for many orders via one listing call.
+
+        One `get_orders` request covers every order still in the listing;
+        orders that have dropped out (e.g. long-terminal) fall back to the
+        single-order endpoint. A failing fallback lookup only omits that one
+        id from the mapping (the caller's next sweep retries it) instead of
+        aborting the whole bulk call.
+        """
+        wanted = set(venue_order_ids)
+        statuses: dict[VenueOrderId, tuple[str, int]] = {}
+        orders = await self._client.get_orders(limit=200)
+        for o in orders:
+            if o.order_id in wanted:
+                statuses[o.order_id] = (str(o.status or ""), int(o.fill_count or 0))
+        for venue_order_id in wanted - statuses.keys():
+            try:
+                statuses[venue_order_id] = await self.get_order_status(venue_order_id)
+            except Exception:  # noqa: BLE001 - degrade per order, not per sweep
+                # Freshly created orders 404 until visible (eventual
+                # consistency); skip this id and leave the rest of the sweep
+                # intact.
+                continue
+        return statuses
+
     async def get_positions_snapshot(self) -> PositionSnapshot:
         """Fetch and normalize current positions from Kalshi."""
         positions = await self._client.get_positions(limit=200)
+        # model_construct skips re-validation: the fields are normalized right
+        # here from an already-validated client response.
         normalized = [
-            Position(
+            Position.model_construct(
                 ticker=p.ticker,
                 position=int(p.position or 0),
                 market_exposure_dollars=float(p.market_exposure_dollars or 0.0),
@@ -75,7 +105,7 @@ class KalshiExecutionAdapter(ExecutionAdapter):
             )
             for p in positions
         ]
-        return PositionSnapshot(venue=self.venue, positions=normalized)
+        return PositionSnapshot.model_construct(venue=self.venue, positions=normalized)
 
     async def get_market_snapshot(self, ticker: str, *, orderbook_depth: int = 10) -> TickerMarketSnapshot:
         """Fetch market + orderbook and return a normalized ticker-scoped snapshot."""
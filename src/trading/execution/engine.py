@@ -24,9 +24,14 @@ from ..models import (
     OrderUpdate,
     SubmitOrder,
     VenueOrderId,
+    utc_now,
 )
 from .adapters.base import ExecutionAdapter
 
+# Unchanged position snapshots are suppressed, but every Nth poll republishes
+# anyway so late or recovering subscribers re-sync.
+_POSITIONS_RESYNC_TICKS = 10
+
 
 class ExecutionEngine:
     """Background worker that translates commands into venue actions + events.
@@ -55,30 +60,58 @@ class ExecutionEngine:
         self._poll_interval_s = poll_interval_s
         self._positions_interval_s = positions_interval_s
 
-        # venue_order_id -> {status, fill_count}
-        self._tracked: dict[VenueOrderId, dict[str, int | str]] = {}
+        # Tracked-order state as parallel dicts (keyed by venue_order_id):
+        # cheaper than a per-order dict, which cost an allocation plus keyed
+        # lookups and coercions on every poll iteration.
+        self._status: dict[VenueOrderId, str] = {}
+        self._fill_count: dict[VenueOrderId, int] = {}
+
+        # Signature of the last published position snapshot (change detection).
+        self._last_positions_sig: int | None = None
+
+        # Set while any order is tracked; the poll loop sleeps on it when
+        # idle instead of waking every interval for nothing.
+        self._has_tracked = asyncio.Event()
+
+        # Pulsed on submit/cancel: interrupts a backed-off inter-poll sleep so
+        # fresh orders are swept at the base interval, not the stretched one.
+        self._poll_wake = asyncio.Event()
+
+        # Command dispatch by concrete type: one dict lookup per command
+        # instead of an isinstance chain.
+        self._command_handlers = {
+            SubmitOrder: self._handle_submit,
+            CancelOrder: self._handle_cancel,
+        }
 
     @property
     def tracked_orders(self) -> Mapping[VenueOrderId, dict[str, int | str]]:
         """Snapshot of orders currently tracked by the polling loop."""
-        return dict(self._tracked)
+        return {
+            venue_order_id: {"status": status, "fill_count": self._fill_count[venue_order_id]}
+            for venue_order_id, status in self._status.items()
+        }
 
     async def run(self) -> None:
-        """Run command consumer and polling loops forever."""
-        consumer = asyncio.create_task(self._consume_commands(), name="execution-consume-commands")
-        poller = asyncio.create_task(self._poll_orders_loop(), name="execution-poll-orders")
-        positions = asyncio.create_task(self._poll_positions_loop(), name="execution-poll-positions")
-        await asyncio.gather(consumer, poller, positions)
+        """Run command consumer and polling loops forever.
+
+        TaskGroup gives structured cancellation: if one loop fails (or the
+        engine is cancelled), the siblings are cancelled with it instead of
+        lingering past the gather.
+        """
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._consume_commands(), name="execution-consume-commands")
+            tg.create_task(self._poll_orders_loop(), name="execution-poll-orders")
+            tg.create_task(self._poll_positions_loop(), name="execution-poll-positions")
 
     async def _consume_commands(self) -> None:
         """Continuously consume commands and dispatch handlers."""
         while True:
             cmd = await self._commands.get()
             try:
-                if isinstance(cmd, SubmitOrder):
-                    await self._handle_submit(cmd.request)
-                elif isinstance(cmd, CancelOrder):
-                    await self._handle_cancel(cmd.venue_order_id, reason=cmd.reason)
+                handler = self._command_handlers.get(type(cmd))
+                if handler is not None:
+                    await handler(cmd)
                 else:
                     await self._events.publish(
                         ExecutionError(message=f"Unknown command type: {type(cmd)!r}", retryable=False),
@@ -87,8 +120,9 @@ class ExecutionEngine:
             finally:
                 self._commands.task_done()
 
-    async def _handle_submit(self, request: OrderRequest) -> None:
+    async def _handle_submit(self, cmd: SubmitOrder) -> None:
         """Place an order via the adapter and publish the resulting event(s)."""
+        request = cmd.request
         try:
             venue_order_id = await self._adapter.place_order(request)
         except Exception as exc:  # noqa: BLE001 - normalize into event stream
@@ -103,14 +137,18 @@ class ExecutionEngine:
             )
             return
 
-        self._tracked[venue_order_id] = {"status": "submitted", "fill_count": 0}
+        self._status[venue_order_id] = "submitted"
+        self._fill_count[venue_order_id] = 0
+        self._has_tracked.set()
+        self._poll_wake.set()
         await self._events.publish(
             OrderSubmitted(trade_id=request.trade_id, venue=request.venue, venue_order_id=venue_order_id, request=request),
             stage="execution_engine",
         )
 
-    async def _handle_cancel(self, venue_order_id: VenueOrderId, *, reason: str | None) -> None:
+    async def _handle_cancel(self, cmd: CancelOrder) -> None:
         """Cancel an order via the adapter and publish a cancellation event."""
+        venue_order_id = cmd.venue_order_id
         try:
             await self._adapter.cancel_order(venue_order_id)
         except Exception as exc:  # noqa: BLE001 - normalize into event stream
@@ -124,63 +162,121 @@ class ExecutionEngine:
             )
             return
 
+        self._poll_wake.set()
         await self._events.publish(
-            OrderCanceled(venue="kalshi", venue_order_id=venue_order_id, reason=reason),
+            OrderCanceled(venue="kalshi", venue_order_id=venue_order_id, reason=cmd.reason),
             stage="execution_engine",
         )
 
     async def _poll_orders_loop(self) -> None:
-        """Poll tracked orders and publish status/fill updates on change."""
+        """Poll tracked orders and publish status/fill updates on change.
+
+        While nothing is tracked the loop parks on `_has_tracked` instead of
+        waking every interval, and consecutive unchanged sweeps back the sleep
+        off exponentially (capped) so quiet resting orders cost fewer venue
+        round trips; any observed change snaps back to the base interval. A
+        submit or cancel pulses `_poll_wake`, cutting a stretched sleep short
+        so the fresh order is swept at the base interval immediately.
+        """
+        delay = self._poll_interval_s
+        max_delay = self._poll_interval_s * 8
         while True:
-            await asyncio.sleep(self._poll_interval_s)
-            if not self._tracked:
+            if not self._status:
+                # No awaits between the emptiness check and clear(), so a
+                # submit can't slip in and lose its wakeup.
+                self._has_tracked.clear()
+                await self._has_tracked.wait()
+                delay = self._poll_interval_s
+            try:
+                await asyncio.wait_for(self._poll_wake.wait(), timeout=delay)
+            except TimeoutError:
+                pass
+            else:
+                self._poll_wake.clear()
+                delay = self._poll_interval_s
+                await asyncio.sleep(delay)
+            if not self._status:
                 continue
 
-            for venue_order_id in list(self._tracked.keys()):
-                try:
-                    status, fill_count = await self._adapter.get_order_status(venue_order_id)
-                except Exception as exc:  # noqa: BLE001 - keep going
-                    await self._events.publish(
-                        ExecutionError(
-                            venue_order_id=venue_order_id,
-                            message=f"get_order_status failed: {exc}",
-                            retryable=True,
-                        ),
-                        stage="execution_engine",
-                    )
+            # One bulk status call covers the whole sweep: O(1) venue requests
+            # per tick instead of one per tracked order.
+            ids = list(self._status.keys())
+            try:
+                statuses = await self._adapter.get_orders_status(ids)
+            except Exception as exc:  # noqa: BLE001 - keep going
+                await self._events.publish(
+                    ExecutionError(
+                        message=f"get_orders_status failed: {exc}",
+                        retryable=True,
+                    ),
+                    stage="execution_engine",
+                )
+                continue
+            # Collect the tick's events and publish them in one batched call,
+            # so the recorder and subscriber fan-out run once per sweep. One
+            # timestamp covers the whole tick instead of one clock read per
+            # event default_factory.
+            ts = utc_now()
+            events: list[OrderUpdate | FillUpdate] = []
+            for venue_order_id in ids:
+                polled = statuses.get(venue_order_id)
+                if polled is None:
                     continue
+                status, fill_count = polled
 
-                prev_status = str(self._tracked[venue_order_id].get("status", ""))
-                prev_fill = int(self._tracked[venue_order_id].get("fill_count", 0))
+                prev_status = self._status[venue_order_id]
+                prev_fill = self._fill_count[venue_order_id]
 
                 changed = (status != prev_status) or (fill_count != prev_fill)
                 if not changed:
                     continue
 
-                self._tracked[venue_order_id] = {"status": status, "fill_count": fill_count}
+                self._status[venue_order_id] = status
+                self._fill_count[venue_order_id] = fill_count
 
-                await self._events.publish(
-                    OrderUpdate(venue="kalshi", trade_id=venue_order_id if venue_order_id else None, venue_order_id=venue_order_id, status=status, fill_count=fill_count),
-                    stage="execution_engine",
+                # model_construct skips validation: every field is produced
+                # in-process with the right type on this per-tick hot path.
+                events.append(
+                    OrderUpdate.model_construct(
+                        venue="kalshi",
+                        trade_id=venue_order_id if venue_order_id else None,
+                        venue_order_id=venue_order_id,
+                        status=status,
+                        fill_count=fill_count,
+                        ts=ts,
+                    )
                 )
 
                 if fill_count > prev_fill:
-                    await self._events.publish(
-                        FillUpdate(
+                    events.append(
+                        FillUpdate.model_construct(
                             venue="kalshi",
                             trade_id=venue_order_id if venue_order_id else None,
                             venue_order_id=venue_order_id,
                             filled_delta=fill_count - prev_fill,
                             filled_total=fill_count,
-                        ),
-                        stage="execution_engine",
+                            ts=ts,
+                        )
                     )
 
                 if status in {"executed", "canceled"}:
-                    self._tracked.pop(venue_order_id, None)
+                    self._status.pop(venue_order_id, None)
+                    self._fill_count.pop(venue_order_id, None)
+
+            if events:
+                await self._events.publish_many(events, stage="execution_engine")
+                delay = self._poll_interval_s
+            else:
+                delay = min(delay * 2, max_delay)
 
     async def _poll_positions_loop(self) -> None:
-        """Periodically poll positions and publish snapshots."""
+        """Periodically poll positions and publish snapshots on change.
+
+        A snapshot identical to the last published one is suppressed so
+        subscribers and the recorder skip redundant work, except every
+        `_POSITIONS_RESYNC_TICKS` polls when it is republished regardless.
+        """
+        unchanged_ticks = 0
         while True:
             await asyncio.sleep(self._positions_interval_s)
             try:
@@ -191,5 +287,19 @@ class ExecutionEngine:
                     stage="execution_engine",
                 )
                 continue
+
+            sig = hash(
+                tuple(
+                    sorted(
+                        (p.ticker, p.position, p.market_exposure_dollars)
+                        for p in snapshot.positions
+                    )
+                )
+            )
+            if sig == self._last_positions_sig and unchanged_ticks < _POSITIONS_RESYNC_TICKS - 1:
+                unchanged_ticks += 1
+                continue
+            unchanged_ticks = 0
+            self._last_positions_sig = sig
             await self._events.publish(snapshot, stage="execution_engine")
 
@@ -15,6 +15,7 @@ import math
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 from pydantic import BaseModel, ConfigDict
@@ -25,6 +26,8 @@ from ..models import (
     ExecutionEvent,
     FillUpdate,
     MarketSnapshot,
+    OrderCanceled,
+    OrderRejected,
     OrderRequest,
     OrderSubmitted,
     OrderUpdate,
@@ -46,6 +49,18 @@ def _utc_now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
+@dataclass(slots=True)
+class _OrderState:
+    """Mutable per-order execution state.
+
+    One dict entry holding a slotted record instead of parallel status/fill
+    dicts: half the hash lookups per update and one key stored, not two.
+    """
+
+    status: str
+    fill_count: int
+
+
 class PortfolioManagerConfigLike(Protocol):
     """Protocol for PM config (avoids importing app config into trading package)."""
 
@@ -168,6 +183,28 @@ class PortfolioManager:
     and emits a structured decision log for every intent.
     """
 
+    # Fixed-offset attribute storage: the event-handling hot path reads these
+    # on every inbound event, and slots skip the per-instance __dict__ probe.
+    __slots__ = (
+        "_commands",
+        "_events",
+        "_config",
+        "_intent_bus",
+        "_resolver",
+        "_market_state_service",
+        "_recorder",
+        "_event_subscription",
+        "_intent_subscription",
+        "_venue_order_by_trade",
+        "_venue_order_by_trade_view",
+        "_orders",
+        "_latest_positions",
+        "_submit_futures",
+        "_order_executed_events",
+        "_order_canceled_events",
+        "_event_handlers",
+    )
+
     def __init__(
         self,
         *,
@@ -178,6 +215,7 @@ class PortfolioManager:
         market_resolver: MarketResolver | None = None,
         market_state_service: MarketStateService | None = None,
         recorder: Any = None,
+        event_queue_maxsize: int = 10_000,
     ) -> None:
         """Create a portfolio manager attached to the given buses and config.
 
@@ -185,6 +223,8 @@ class PortfolioManager:
         provided, run_intent_consumer() will consume intents and submit orders
         using the six-step pipeline. config is required for intent handling.
         recorder, when provided, receives each PM decision for observability.
+        event_queue_maxsize bounds the execution-event subscription queue so a
+        stalled consumer cannot grow memory without limit.
         """
         self._commands = execution_command_bus
         self._events = execution_event_bus
@@ -194,20 +234,42 @@ class PortfolioManager:
         self._market_state_service = market_state_service
         self._recorder = recorder
 
-        self._event_subscription = self._events.subscribe()
+        self._event_subscription = self._events.subscribe(maxsize=event_queue_maxsize)
         self._intent_subscription = trade_intent_bus.subscribe() if trade_intent_bus else None
 
         self._venue_order_by_trade: dict[TradeId, VenueOrderId] = {}
-        self._order_status: dict[VenueOrderId, str] = {}
-        self._order_fill_count: dict[VenueOrderId, int] = {}
+        # Live read-only view handed out by the property: O(1) per access
+        # versus copying the dict, and mutation is blocked at runtime too.
+        self._venue_order_by_trade_view: Mapping[TradeId, VenueOrderId] = MappingProxyType(
+            self._venue_order_by_trade
+        )
+        self._orders: dict[VenueOrderId, _OrderState] = {}
         self._latest_positions: PositionSnapshot | None = None
 
-        self._order_submitted_events: dict[TradeId, asyncio.Event] = {}
+        # Submission outcome as a Future per trade: resolves to the venue
+        # order id on OrderSubmitted and raises on OrderRejected, so waiters
+        # get the id (or the rejection) from a single awaitable.
+        self._submit_futures: dict[TradeId, asyncio.Future[VenueOrderId]] = {}
+        # Keyed completion events: waiters block on one Event per order instead
+        # of subscribing to the event bus and filtering every published event.
+        self._order_executed_events: dict[VenueOrderId, asyncio.Event] = {}
+        self._order_canceled_events: dict[VenueOrderId, asyncio.Event] = {}
+
+        # Event dispatch by concrete type: one dict lookup per event instead
+        # of an isinstance chain.
+        self._event_handlers = {
+            OrderSubmitted: self._on_order_submitted,
+            OrderRejected: self._on_order_rejected,
+            OrderUpdate: self._on_order_update,
+            OrderCanceled: self._on_order_canceled,
+            FillUpdate: self._on_fill_update,
+            PositionSnapshot: self._on_position_snapshot,
+        }
 
     @property
     def venue_order_by_trade(self) -> Mapping[TradeId, VenueOrderId]:
-        """Map of `trade_id -> venue_order_id` observed so far."""
-        return dict(self._venue_order_by_trade)
+        """Read-only live view of `trade_id -> venue_order_id` observed so far."""
+        return self._venue_order_by_trade_view
 
     @property
     def latest_positions(self) -> PositionSnapshot | None:
@@ -215,10 +277,54 @@ class PortfolioManager:
         return self._latest_positions
 
     async def run(self) -> None:
-        """Consume execution events forever."""
+        """Consume execution events forever.
+
+        Blocks for the first event, then drains whatever else is already
+        queued before yielding — one scheduler wake per burst instead of one
+        per event. Within a burst, runs of OrderUpdate and FillUpdate events
+        are coalesced per venue_order_id (only the latest status / highest
+        fill total matters for in-memory state), so a backlog of N updates
+        for the same order costs one state write instead of N. Pending
+        coalesced state is flushed before any other event type is handled,
+        so cross-type ordering (e.g. an update followed by OrderCanceled for
+        the same order) is preserved.
+        """
+        subscription = self._event_subscription
+        latest_update: dict[VenueOrderId, OrderUpdate] = {}
+        latest_fill: dict[VenueOrderId, FillUpdate] = {}
         while True:
-            event: ExecutionEvent = await self._event_subscription.get()
-            await self._handle_event(event)
+            event: ExecutionEvent = await subscription.get()
+            while True:
+                event_type = type(event)
+                if event_type is OrderUpdate:
+                    latest_update[event.venue_order_id] = event
+                elif event_type is FillUpdate:
+                    prev = latest_fill.get(event.venue_order_id)
+                    if prev is None or event.filled_total > prev.filled_total:
+                        latest_fill[event.venue_order_id] = event
+                else:
+                    self._apply_coalesced(latest_update, latest_fill)
+                    await self._handle_event(event)
+                try:
+                    event = subscription.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+            self._apply_coalesced(latest_update, latest_fill)
+
+    def _apply_coalesced(
+        self,
+        latest_update: dict[VenueOrderId, OrderUpdate],
+        latest_fill: dict[VenueOrderId, FillUpdate],
+    ) -> None:
+        """Apply and clear the coalesced per-order update/fill state."""
+        if latest_update:
+            for update in latest_update.values():
+                self._on_order_update(update)
+            latest_update.clear()
+        if latest_fill:
+            for fill in latest_fill.values():
+                self._on_fill_update(fill)
+            latest_fill.clear()
 
     async def run_intent_consumer(self) -> None:
         """Consume trade intents forever and submit orders via the six-step pipeline.
@@ -244,7 +350,7 @@ class PortfolioManager:
         if self._recorder is not None and hasattr(self._recorder, "record_message"):
             # Observability: pass a message with .type so event_type is pm_decision; summary = model_dump()
             obs_msg = PMDecisionObservabilityMessage.from_record(record)
-            await self._recorder.record_message(obs_msg, kind="event", stage="portfolio_manager")
+            self._recorder.record_message(obs_msg, kind="event", stage="portfolio_manager")
 
     async def _handle_intent(self, intent: TradeIntent) -> None:
         """Six-step pipeline: resolve -> snapshot -> edge -> Kelly -> cap -> submit."""
@@ -359,9 +465,30 @@ class PortfolioManager:
         await self._log_decision(record)
         await self.submit_order(request)
 
+    @staticmethod
+    def _event_for(events: dict[VenueOrderId, asyncio.Event], venue_order_id: VenueOrderId) -> asyncio.Event:
+        """Get or create a keyed completion Event, constructing only on a miss.
+
+        setdefault would build (and usually discard) a fresh asyncio.Event —
+        waiter deque and all — on every call, hit or miss.
+        """
+        ev = events.get(venue_order_id)
+        if ev is None:
+            ev = asyncio.Event()
+            events[venue_order_id] = ev
+        return ev
+
+    def _submit_future(self, trade_id: TradeId) -> asyncio.Future[VenueOrderId]:
+        """Get or create the submission-outcome future for a trade."""
+        fut = self._submit_futures.get(trade_id)
+        if fut is None:
+            fut = asyncio.get_running_loop().create_future()
+            self._submit_futures[trade_id] = fut
+        return fut
+
     async def submit_order(self, request: OrderRequest) -> None:
         """Submit an order directly via the execution engine."""
-        self._order_submitted_events.setdefault(request.trade_id, asyncio.Event())
+        self._submit_future(request.trade_id)
         await self._commands.put(SubmitOrder(request=request), stage="portfolio_manager")
 
     async def cancel_order(self, venue_order_id: VenueOrderId, *, reason: str | None = None) -> None:
@@ -369,29 +496,73 @@ class PortfolioManager:
         await self._commands.put(CancelOrder(venue_order_id=venue_order_id, reason=reason), stage="portfolio_manager")
 
     async def wait_for_order_submitted(self, trade_id: TradeId, *, timeout_s: float = 10.0) -> VenueOrderId:
-        """Wait until we have a venue order id for a trade directly via the execution engine."""
-        ev = self._order_submitted_events.setdefault(trade_id, asyncio.Event())
+        """Wait for the venue order id for a trade; raises if the order was rejected.
+
+        The future is shielded so a waiter's timeout does not consume the
+        outcome for other (or later) waiters.
+        """
+        fut = self._submit_future(trade_id)
+        return await asyncio.wait_for(asyncio.shield(fut), timeout=timeout_s)
+
+    async def wait_for_order_executed(self, venue_order_id: VenueOrderId, *, timeout_s: float = 10.0) -> None:
+        """Wait until an order reaches terminal executed status (event-driven, no bus filtering)."""
+        ev = self._event_for(self._order_executed_events, venue_order_id)
+        await asyncio.wait_for(ev.wait(), timeout=timeout_s)
+
+    async def wait_for_order_canceled(self, venue_order_id: VenueOrderId, *, timeout_s: float = 10.0) -> None:
+        """Wait until an order is confirmed canceled (event-driven, no bus filtering)."""
+        ev = self._event_for(self._order_canceled_events, venue_order_id)
         await asyncio.wait_for(ev.wait(), timeout=timeout_s)
-        return self._venue_order_by_trade[trade_id]
 
     async def _handle_event(self, event: ExecutionEvent) -> None:
         """Update local state in response to an execution event."""
-        if isinstance(event, OrderSubmitted):
-            self._venue_order_by_trade[event.trade_id] = event.venue_order_id
-            self._order_status[event.venue_order_id] = "submitted"
-            self._order_fill_count[event.venue_order_id] = 0
-            self._order_submitted_events.setdefault(event.trade_id, asyncio.Event()).set()
-            return
-
-        if isinstance(event, OrderUpdate):
-            self._order_status[event.venue_order_id] = event.status
-            self._order_fill_count[event.venue_order_id] = event.fill_count
-            return
+        handler = self._event_handlers.get(type(event))
+        if handler is not None:
+            handler(event)
+
+    def _on_order_submitted(self, event: OrderSubmitted) -> None:
+        self._venue_order_by_trade[event.trade_id] = event.venue_order_id
+        self._orders[event.venue_order_id] = _OrderState("submitted", 0)
+        fut = self._submit_future(event.trade_id)
+        if not fut.done():
+            fut.set_result(event.venue_order_id)
+
+    def _on_order_rejected(self, event: OrderRejected) -> None:
+        fut = self._submit_future(event.trade_id)
+        if not fut.done():
+            fut.set_exception(RuntimeError(f"order rejected: {event.message}"))
+            # The intent pipeline fires submit_order without awaiting the
+            # future; mark the exception retrieved so an unawaited rejection
+            # doesn't log "Future exception was never retrieved" at GC time.
+            # Waiters that do await still see the exception raised.
+            fut.exception()
+
+    def _on_order_update(self, event: OrderUpdate) -> None:
+        state = self._orders.get(event.venue_order_id)
+        if state is None:
+            self._orders[event.venue_order_id] = _OrderState(event.status, event.fill_count)
+        else:
+            state.status = event.status
+            state.fill_count = event.fill_count
+        if event.status == "executed":
+            self._event_for(self._order_executed_events, event.venue_order_id).set()
+        elif event.status == "canceled":
+            self._event_for(self._order_canceled_events, event.venue_order_id).set()
+
+    def _on_order_canceled(self, event: OrderCanceled) -> None:
+        state = self._orders.get(event.venue_order_id)
+        if state is None:
+            self._orders[event.venue_order_id] = _OrderState("canceled", 0)
+        else:
+            state.status = "canceled"
+        self._event_for(self._order_canceled_events, event.venue_order_id).set()
 
-        if isinstance(event, FillUpdate):
-            self._order_fill_count[event.venue_order_id] = event.filled_total
-            return
+    def _on_fill_update(self, event: FillUpdate) -> None:
+        state = self._orders.get(event.venue_order_id)
+        if state is None:
+            self._orders[event.venue_order_id] = _OrderState("", event.filled_total)
+        else:
+            state.fill_count = event.filled_total
 
-        if isinstance(event, PositionSnapshot):
-            self._latest_positions = event
-            return
+    def _on_position_snapshot(self, event: PositionSnapshot) -> None:
+        self._latest_positions = event
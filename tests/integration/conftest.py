@@ -0,0 +1,101 @@
+"""Shared fixtures/helpers for integration tests against the real Kalshi demo API."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+
+import pytest
+import pytest_asyncio
+
+from config import KalshiConfig, load_config
+from kalshi.client import KalshiClient
+
+
+@functools.lru_cache(maxsize=1)
+def cached_kalshi_config() -> KalshiConfig:
+    """Load config once per test session; `.env` doesn't change mid-run."""
+    return load_config().kalshi
+
+
+def has_real_kalshi_creds() -> bool:
+    # `load_config()` is responsible for loading `.env` via dotenv.load_dotenv().
+    # We must call it before reading env vars, otherwise integration tests will
+    # skip even when `.env` is present.
+    try:
+        cfg = cached_kalshi_config()
+    except Exception:
+        return False
+
+    return bool(cfg.api_key and cfg.private_key)
+
+
+def demo_config() -> KalshiConfig:
+    """Load config but force demo environment for integration tests.
+
+    model_copy copies the already-validated config with one override, so the
+    PEM validator doesn't re-run per call.
+    """
+    return cached_kalshi_config().model_copy(update={"use_demo": True})
+
+
+async def close_client(client: KalshiClient) -> None:
+    """Tear down a client (worker task + connection pool)."""
+    await client.aclose()
+
+
+async def _poll_until(fetch, predicate, *, base: float = 0.05, mult: float = 2.0, cap: float = 1.0, timeout_s: float):
+    """Await `fetch()` with exponential backoff until `predicate(result)` or timeout.
+
+    404s from `fetch` are treated as "not there yet" (eventual consistency)
+    and retried; other errors propagate. Returns the last fetched result —
+    which may not satisfy the predicate if the deadline passed — or None if
+    every attempt 404'd.
+    """
+    deadline = time.monotonic() + timeout_s
+    delay = base
+    last = None
+    while True:
+        try:
+            last = await fetch()
+        except Exception as exc:  # noqa: BLE001 - eventual consistency / transient errors
+            if getattr(exc, "status_code", None) != 404:
+                raise
+        else:
+            if predicate(last):
+                return last
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return last
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * mult, cap)
+
+
+@pytest.fixture(scope="session")
+def poll_until():
+    """Share the backoff polling helper across integration modules.
+
+    Exposed as a fixture because the test directories aren't packages, so a
+    plain `import conftest` would be ambiguous between tests/unit and
+    tests/integration on sys.path.
+    """
+    return _poll_until
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def demo_client() -> KalshiClient:
+    """One demo-environment client per test module.
+
+    Client construction parses the PEM private key and each client spins up
+    its own request worker; sharing one instance per module avoids paying
+    that per test. Tests using this fixture must run on the module loop
+    (`@pytest.mark.asyncio(loop_scope="module")`) so the worker task and the
+    tests share an event loop.
+    """
+    if not has_real_kalshi_creds():
+        pytest.skip("Missing real KALSHI_API_KEY/KALSHI_PRIVATE_KEY; skipping network integration test.")
+
+    client = KalshiClient(demo_config())
+    yield client
+    await close_client(client)
@@ -1,103 +1,48 @@
 from __future__ import annotations
 
-import asyncio
-import os
 from contextlib import suppress
 import time as _time
 
 import pytest
 
-from config import KalshiConfig, load_config
 from kalshi.client import KalshiClient
 from kalshi.models import KalshiOrder
 
 
-def _has_real_kalshi_creds() -> bool:
-    # `load_config()` is responsible for loading `.env` via dotenv.load_dotenv().
-    # We must call it before reading env vars, otherwise integration tests will
-    # skip even when `.env` is present.
-    try:
-        cfg = load_config().kalshi
-    except Exception:
-        return False
-
-    return bool(cfg.api_key and cfg.private_key)
-
-
-def _demo_config() -> KalshiConfig:
-    """Load config but force demo environment for integration tests."""
-    cfg = load_config().kalshi
-    return KalshiConfig(
-        api_key=cfg.api_key,
-        private_key=cfg.private_key,
-        use_demo=True,
-        rate_limit=cfg.rate_limit,
-        max_attempt=cfg.max_attempt,
-        base_delay=cfg.base_delay,
-        backoff_multiplier=cfg.backoff_multiplier,
-        max_delay=cfg.max_delay,
-        orderbook_depth=cfg.orderbook_depth,
-    )
-
-
-async def _close_client(client: KalshiClient) -> None:
-    if client._request_worker_task is not None:
-        client._request_worker_task.cancel()
-        with suppress(asyncio.CancelledError):
-            await client._request_worker_task
-
-
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.integration
-async def test_integration_get_balance_hits_network() -> None:
+async def test_integration_get_balance_hits_network(demo_client: KalshiClient) -> None:
     """Hits the real Kalshi API to verify auth/signing + request plumbing.
 
     To run:
     - set KALSHI_API_KEY / KALSHI_PRIVATE_KEY (and optionally KALSHI_USE_DEMO)
     - run: pytest -m integration
     """
-    if not _has_real_kalshi_creds():
-        pytest.skip("Missing real KALSHI_API_KEY/KALSHI_PRIVATE_KEY; skipping network integration test.")
-
-    client = KalshiClient(_demo_config())
-    try:
-        balance = await client.get_balance()
-        assert isinstance(balance.balance, int)
-        assert balance.balance >= 0
-    finally:
-        await _close_client(client)
+    balance = await demo_client.get_balance()
+    assert isinstance(balance.balance, int)
+    assert balance.balance >= 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.integration
-async def test_integration_demo_get_markets_and_orderbook() -> None:
+async def test_integration_demo_get_markets_and_orderbook(demo_client: KalshiClient) -> None:
     """Fetch real demo markets and an orderbook."""
-    if not _has_real_kalshi_creds():
-        pytest.skip("Missing real KALSHI_API_KEY/KALSHI_PRIVATE_KEY; skipping network integration test.")
+    markets = await demo_client.get_markets(status="open", limit=5)
+    assert markets, "Expected at least one open market in demo"
 
-    client = KalshiClient(_demo_config())
-    try:
-        markets = await client.get_markets(status="open", limit=5)
-        assert markets, "Expected at least one open market in demo"
-
-        market = await client.get_market(markets[0].ticker)
-        assert market.ticker
+    market = await demo_client.get_market(markets[0].ticker)
+    assert market.ticker
 
-        orderbook = await client.get_market_orderbook(market.ticker, depth=1)
-        assert isinstance(orderbook.yes_dollars, list)
-        assert isinstance(orderbook.no_dollars, list)
-    finally:
-        await _close_client(client)
+    orderbook = await demo_client.get_market_orderbook(market.ticker, depth=1)
+    assert isinstance(orderbook.yes_dollars, list)
+    assert isinstance(orderbook.no_dollars, list)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.integration
-async def test_integration_demo_create_get_cancel_order_roundtrip() -> None:
+async def test_integration_demo_create_get_cancel_order_roundtrip(demo_client: KalshiClient, poll_until) -> None:
     """Create a real demo order, fetch it, then cancel it."""
-    if not _has_real_kalshi_creds():
-        pytest.skip("Missing real KALSHI_API_KEY/KALSHI_PRIVATE_KEY; skipping network integration test.")
-
-    client = KalshiClient(_demo_config())
+    client = demo_client
     created_order_id: str | None = None
     try:
         # Find an open *binary* market ticker (our create_order uses yes/no sides).
@@ -158,16 +103,11 @@ async def test_integration_demo_create_get_cancel_order_roundtrip() -> None:
         assert any(o.order_id == created_order_id for o in orders_before_cancel)
 
         # Runtime evidence: immediate GetOrder can 404 right after create (eventual consistency).
-        fetched = None
-        for attempt in range(1, 16):
-            try:
-                fetched = await client.get_order(created_order_id)
-                break
-            except Exception as exc:  # noqa: BLE001
-                if getattr(exc, "status_code", None) == 404:
-                    await asyncio.sleep(0.2)
-                    continue
-                raise
+        fetched = await poll_until(
+            lambda: client.get_order(created_order_id),
+            lambda o: True,
+            timeout_s=3.0,
+        )
 
         assert fetched is not None, "Expected get_order to succeed after create (within retry window)"
         assert fetched.order_id == created_order_id
@@ -176,11 +116,11 @@ async def test_integration_demo_create_get_cancel_order_roundtrip() -> None:
         await client.cancel_order(created_order_id)
 
         # Cancel is synchronous, but allow a short window for the status to reflect.
-        for _ in range(10):
-            fetched2 = await client.get_order(created_order_id)
-            if fetched2.status == "canceled":
-                break
-            await asyncio.sleep(0.2)
+        await poll_until(
+            lambda: client.get_order(created_order_id),
+            lambda o: o.status == "canceled",
+            timeout_s=2.0,
+        )
 
         final = await client.get_order(created_order_id)
 
@@ -192,5 +132,3 @@ async def test_integration_demo_create_get_cancel_order_roundtrip() -> None:
         if created_order_id is not None:
             with suppress(Exception):
                 await client.cancel_order(created_order_id)
-        await _close_client(client)
-
@@ -7,7 +7,6 @@ from contextlib import suppress
 
 import pytest
 
-from config import KalshiConfig, load_config
 from kalshi.client import KalshiClient
 from kalshi.models import KalshiOrder
 
@@ -54,27 +53,9 @@ def _ceil_to_step(value: float, step: float) -> float:
     return round((n + 1) * step, 4)
 
 
-def _demo_config() -> KalshiConfig:
-    """Load config but force demo environment for live trading tests."""
-    cfg = load_config().kalshi
-    return KalshiConfig(
-        api_key=cfg.api_key,
-        private_key=cfg.private_key,
-        use_demo=True,
-        rate_limit=cfg.rate_limit,
-        max_attempt=cfg.max_attempt,
-        base_delay=cfg.base_delay,
-        backoff_multiplier=cfg.backoff_multiplier,
-        max_delay=cfg.max_delay,
-        orderbook_depth=cfg.orderbook_depth,
-    )
-
-
-async def _close_client(client: KalshiClient) -> None:
-    if client._request_worker_task is not None:
-        client._request_worker_task.cancel()
-        with suppress(asyncio.CancelledError):
-            await client._request_worker_task
+# Terminal order statuses; the model already types status as str, so polls
+# compare the attribute directly against this frozenset.
+_TERMINAL = frozenset({"executed", "canceled"})
 
 
 def _should_run_live_trading() -> bool:
@@ -86,36 +67,28 @@ async def _wait_for_terminal_order_status(
     client: KalshiClient,
     order_id: str,
     *,
+    poll_until,
     timeout_s: float = 60.0,
 ) -> str:
     """Poll order status until it reaches a terminal-ish state or times out.
 
     We treat `executed` as success. `canceled` is terminal but not success for this test.
     """
-    deadline = time.monotonic() + timeout_s
-    last_status: str | None = None
-
-    while time.monotonic() < deadline:
-        try:
-            o = await client.get_order(order_id)
-        except Exception as exc:  # noqa: BLE001 - eventual consistency / transient errors
-            if getattr(exc, "status_code", None) == 404:
-                await asyncio.sleep(0.2)
-                continue
-            raise
-
-        last_status = str(o.status or "")
-        if last_status in {"executed", "canceled"}:
-            return last_status
-        await asyncio.sleep(0.2)
-
+    o = await poll_until(
+        lambda: client.get_order(order_id),
+        lambda o: o.status in _TERMINAL,
+        timeout_s=timeout_s,
+    )
+    last_status = None if o is None else o.status
+    if last_status in _TERMINAL:
+        return last_status
     raise TimeoutError(f"Timed out waiting for order {order_id} status. Last status: {last_status!r}")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.integration
 @pytest.mark.live_trading
-async def test_integration_demo_buy_then_sell_wait_for_fills() -> None:
+async def test_integration_demo_buy_then_sell_wait_for_fills(demo_client: KalshiClient, poll_until) -> None:
     """Place a real BUY then real SELL in demo, waiting for fills.
 
     Safety:
@@ -127,8 +100,7 @@ async def test_integration_demo_buy_then_sell_wait_for_fills() -> None:
     if not _should_run_live_trading():
         pytest.skip("Set KALSHI_RUN_LIVE_TRADING_TESTS=true to enable live trading integration test.")
 
-    cfg = _demo_config()
-    client = KalshiClient(cfg)
+    client = demo_client
     buy_order_id: str | None = None
     sell_order_id: str | None = None
     try:
@@ -170,54 +142,73 @@ async def test_integration_demo_buy_then_sell_wait_for_fills() -> None:
         no_bid_only = 0
         both_bids = 0
 
-        for t in candidates[:500]:
-            if t is None:
-                continue
-            scanned += 1
-            try:
-                ob = await client.get_market_orderbook(t, depth=1)
-            except Exception as exc:  # noqa: BLE001 - skip transient failures
-                continue
-
-            has_yes = bool(ob.yes_dollars)
-            has_no = bool(ob.no_dollars)
-            if has_yes and not has_no:
-                yes_bid_only += 1
-            elif has_no and not has_yes:
-                no_bid_only += 1
-            elif has_yes and has_no:
-                both_bids += 1
-
-            best_yes_bid = ob.yes_dollars[0].dollars if has_yes else 0.0
-            best_no_bid = ob.no_dollars[0].dollars if has_no else 0.0
-
-            if best_yes_bid <= 0.0 and best_no_bid <= 0.0:
-                continue
-
-            m = market_by_ticker.get(t)
-            if m is None:
-                continue
-            event = await client.get_event(m.event_ticker)
-            market_payload = next((x for x in event.get("markets", []) if x.get("ticker") == t), None)
-            if market_payload is None:
-                continue
-            price_ranges = market_payload.get("price_ranges") or []
-
-            # Prefer buying YES if NO bids exist (implied YES ask), otherwise buy NO using YES bids.
-            if best_no_bid > 0.0:
-                implied_yes_ask = 1.0 - best_no_bid
-                step = _step_for_price(price_ranges, implied_yes_ask)
-                buy_side = "yes"
-                buy_price = min(0.99, _ceil_to_step(implied_yes_ask, step))
+        # Each event is fetched at most once; its markets are indexed by ticker
+        # so per-candidate payload lookup is O(1) instead of a linear scan.
+        event_cache: dict[str, dict] = {}
+        payload_index: dict[str, dict] = {}
+
+        # Fan the orderbook fetches out in small batches: the client's internal
+        # rate-limited worker serializes the requests anyway, so concurrent
+        # awaits just keep its pipeline full instead of paying one RTT each.
+        to_scan = [t for t in candidates[:500] if t is not None]
+        _CHUNK = 16
+        for start in range(0, len(to_scan), _CHUNK):
+            chunk = to_scan[start : start + _CHUNK]
+            obs = await asyncio.gather(
+                *(client.get_market_orderbook(t, depth=1) for t in chunk),
+                return_exceptions=True,
+            )
+            for t, ob in zip(chunk, obs):
+                scanned += 1
+                if isinstance(ob, BaseException):  # skip transient failures
+                    continue
+
+                has_yes = bool(ob.yes_dollars)
+                has_no = bool(ob.no_dollars)
+                if has_yes and not has_no:
+                    yes_bid_only += 1
+                elif has_no and not has_yes:
+                    no_bid_only += 1
+                elif has_yes and has_no:
+                    both_bids += 1
+
+                best_yes_bid = ob.yes_dollars[0].dollars if has_yes else 0.0
+                best_no_bid = ob.no_dollars[0].dollars if has_no else 0.0
+
+                if best_yes_bid <= 0.0 and best_no_bid <= 0.0:
+                    continue
+
+                m = market_by_ticker.get(t)
+                if m is None:
+                    continue
+                if m.event_ticker not in event_cache:
+                    event = await client.get_event(m.event_ticker)
+                    event_cache[m.event_ticker] = event
+                    for x in event.get("markets", []):
+                        payload_index[x["ticker"]] = x
+                market_payload = payload_index.get(t)
+                if market_payload is None:
+                    continue
+                price_ranges = market_payload.get("price_ranges") or []
+
+                # Prefer buying YES if NO bids exist (implied YES ask), otherwise buy NO using YES bids.
+                if best_no_bid > 0.0:
+                    implied_yes_ask = 1.0 - best_no_bid
+                    step = _step_for_price(price_ranges, implied_yes_ask)
+                    buy_side = "yes"
+                    buy_price = min(0.99, _ceil_to_step(implied_yes_ask, step))
+                    chosen_ticker = t
+                    break
+
+                implied_no_ask = 1.0 - best_yes_bid
+                step = _step_for_price(price_ranges, implied_no_ask)
+                buy_side = "no"
+                buy_price = min(0.99, _ceil_to_step(implied_no_ask, step))
                 chosen_ticker = t
                 break
 
-            implied_no_ask = 1.0 - best_yes_bid
-            step = _step_for_price(price_ranges, implied_no_ask)
-            buy_side = "no"
-            buy_price = min(0.99, _ceil_to_step(implied_no_ask, step))
-            chosen_ticker = t
-            break
+            if chosen_ticker is not None:
+                break
 
         if chosen_ticker is None or buy_side is None or buy_price is None:
             pytest.skip(
@@ -252,7 +243,7 @@ async def test_integration_demo_buy_then_sell_wait_for_fills() -> None:
         assert buy.order_id
         buy_order_id = buy.order_id
 
-        buy_status = await _wait_for_terminal_order_status(client, buy_order_id, timeout_s=60.0)
+        buy_status = await _wait_for_terminal_order_status(client, buy_order_id, poll_until=poll_until, timeout_s=60.0)
         assert buy_status == "executed", f"Expected buy to execute, got {buy_status!r}"
     finally:
         # Best-effort cleanup: if an order didn't fill, cancel it so we don't leave rests.
@@ -262,5 +253,4 @@ async def test_integration_demo_buy_then_sell_wait_for_fills() -> None:
         if sell_order_id is not None:
             with suppress(Exception):
                 await client.cancel_order(sell_order_id)
-        await _close_client(client)
 
@@ -3,18 +3,24 @@ from __future__ import annotations
 import pytest
 
 
-@pytest.fixture(autouse=True)
-def _no_threads_in_unit_tests(monkeypatch: pytest.MonkeyPatch):
+@pytest.fixture(scope="module", autouse=True)
+def _no_threads_in_unit_tests():
     """Run `asyncio.to_thread` inline for unit tests.
 
     The client uses `asyncio.to_thread` to avoid introducing an async HTTP
     dependency. In unit tests, this can create threadpool workers that keep the
     Python process alive longer than expected under some runtimes.
+
+    Module-scoped: the patch is invariant within a unit module (so per-test
+    apply/revert is pure overhead) but is reverted at each module boundary —
+    a session-wide patch would leave integration tests that run later in the
+    same invocation doing real HTTP inline on the event loop.
     """
 
     async def _to_thread(func, /, *args, **kwargs):  # noqa: ANN001, D401
         return func(*args, **kwargs)
 
-    monkeypatch.setattr("kalshi.client.asyncio.to_thread", _to_thread)
-    yield
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("kalshi.client.asyncio.to_thread", _to_thread)
+        yield
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import asyncio
-from contextlib import suppress
+import json as _json
 from typing import Any
 
 import pytest
@@ -24,7 +23,7 @@ class _FakeResponse:
         self._payload = payload
         self.status_code = status_code
         # `KalshiClient` checks `resp.content` to decide whether to parse JSON.
-        self.content = content if content is not None else b"{}"
+        self.content = content if content is not None else _json.dumps(payload).encode()
 
     def raise_for_status(self) -> None:
         return None
@@ -46,7 +45,7 @@ async def test_get_market_enqueues_and_signs(monkeypatch: pytest.MonkeyPatch) ->
 
     captured: dict[str, Any] = {}
 
-    def fake_request(method: str, url: str, *, headers: dict[str, str], json: Any, timeout: int) -> _FakeResponse:
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
         captured["method"] = method
         captured["url"] = url
         captured["headers"] = headers
@@ -69,7 +68,7 @@ async def test_get_market_enqueues_and_signs(monkeypatch: pytest.MonkeyPatch) ->
             }
         )
 
-    monkeypatch.setattr("kalshi.client.requests.request", fake_request)
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
 
     client = KalshiClient(_make_config())
     try:
@@ -81,17 +80,14 @@ async def test_get_market_enqueues_and_signs(monkeypatch: pytest.MonkeyPatch) ->
         assert captured["json"] is None
 
         headers = captured["headers"]
-        assert headers["KALSHI-ACCESS-KEY"] == "test_key"
-        assert headers["KALSHI-ACCESS-SIGNATURE"] == "c2ln"  # base64(b"sig")
+        assert headers["KALSHI-ACCESS-KEY"] == b"test_key"
+        assert headers["KALSHI-ACCESS-SIGNATURE"] == b"c2ln"  # base64(b"sig")
         assert headers["KALSHI-ACCESS-TIMESTAMP"].isdigit()
 
         assert dummy_key.last_message is not None
         assert dummy_key.last_message.decode("utf-8").endswith("GET/trade-api/v2/markets/ABC")
     finally:
-        if client._request_worker_task is not None:
-            client._request_worker_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await client._request_worker_task
+        await client.aclose()
 
 
 @pytest.mark.asyncio
@@ -99,10 +95,10 @@ async def test_get_markets_signature_strips_query_params(monkeypatch: pytest.Mon
     dummy_key = _DummyPrivateKey()
     monkeypatch.setattr("kalshi.client._load_private_key", lambda _pem: dummy_key)
 
-    def fake_request(method: str, url: str, *, headers: dict[str, str], json: Any, timeout: int) -> _FakeResponse:
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
         return _FakeResponse({"markets": [], "cursor": None})
 
-    monkeypatch.setattr("kalshi.client.requests.request", fake_request)
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
 
     client = KalshiClient(_make_config())
     try:
@@ -113,10 +109,7 @@ async def test_get_markets_signature_strips_query_params(monkeypatch: pytest.Mon
         assert b"?" not in dummy_key.last_message
         assert dummy_key.last_message.decode("utf-8").endswith("GET/trade-api/v2/markets")
     finally:
-        if client._request_worker_task is not None:
-            client._request_worker_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await client._request_worker_task
+        await client.aclose()
 
 
 def test_build_query_string_omits_none_and_encodes_lists(monkeypatch: pytest.MonkeyPatch) -> None:
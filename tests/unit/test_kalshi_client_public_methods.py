@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import asyncio
-from contextlib import suppress
+import json as _json
 from typing import Any
 
 import pytest
@@ -24,7 +23,7 @@ class _FakeResponse:
     def __init__(self, payload: dict[str, Any] | None, *, status_code: int = 200, content: bytes | None = None) -> None:
         self._payload = payload
         self.status_code = status_code
-        self.content = content if content is not None else (b"{}" if payload is not None else b"")
+        self.content = content if content is not None else (_json.dumps(payload).encode() if payload is not None else b"")
 
     def json(self) -> dict[str, Any]:
         if self._payload is None:
@@ -43,7 +42,7 @@ async def test_get_market_orderbook_parses_levels(monkeypatch: pytest.MonkeyPatc
     dummy_key = _DummyPrivateKey()
     monkeypatch.setattr("kalshi.client._load_private_key", lambda _pem: dummy_key)
 
-    def fake_request(method: str, url: str, *, headers: dict[str, str], json: Any, timeout: int) -> _FakeResponse:
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
         assert method == "GET"
         assert url == "https://demo-api.kalshi.co/trade-api/v2/markets/ABC/orderbook?depth=2"
         assert json is None
@@ -56,7 +55,7 @@ async def test_get_market_orderbook_parses_levels(monkeypatch: pytest.MonkeyPatc
             }
         )
 
-    monkeypatch.setattr("kalshi.client.requests.request", fake_request)
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
 
     client = KalshiClient(_make_config())
     try:
@@ -66,10 +65,7 @@ async def test_get_market_orderbook_parses_levels(monkeypatch: pytest.MonkeyPatc
         assert ob.no_dollars[0].dollars == 0.85
         assert ob.no_dollars[0].count == 25
     finally:
-        if client._request_worker_task is not None:
-            client._request_worker_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await client._request_worker_task
+        await client.aclose()
 
 
 @pytest.mark.asyncio
@@ -77,7 +73,7 @@ async def test_get_orders_parses_list(monkeypatch: pytest.MonkeyPatch) -> None:
     dummy_key = _DummyPrivateKey()
     monkeypatch.setattr("kalshi.client._load_private_key", lambda _pem: dummy_key)
 
-    def fake_request(method: str, url: str, *, headers: dict[str, str], json: Any, timeout: int) -> _FakeResponse:
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
         assert method == "GET"
         assert url == "https://demo-api.kalshi.co/trade-api/v2/portfolio/orders?limit=1"
         assert json is None
@@ -101,7 +97,7 @@ async def test_get_orders_parses_list(monkeypatch: pytest.MonkeyPatch) -> None:
             }
         )
 
-    monkeypatch.setattr("kalshi.client.requests.request", fake_request)
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
 
     client = KalshiClient(_make_config())
     try:
@@ -112,10 +108,34 @@ async def test_get_orders_parses_list(monkeypatch: pytest.MonkeyPatch) -> None:
         assert orders[0].count == 2
         assert orders[0].yes_price_dollars == 0.1
     finally:
-        if client._request_worker_task is not None:
-            client._request_worker_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await client._request_worker_task
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_events_sends_real_query_string(monkeypatch: pytest.MonkeyPatch) -> None:
+    dummy_key = _DummyPrivateKey()
+    monkeypatch.setattr("kalshi.client._load_private_key", lambda _pem: dummy_key)
+
+    captured: dict[str, Any] = {}
+
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
+        captured["method"] = method
+        captured["url"] = url
+        return _FakeResponse({"events": [{"event_ticker": "EVT"}], "cursor": ""})
+
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
+
+    client = KalshiClient(_make_config())
+    try:
+        events = await client.get_events(series_ticker="ser", limit=5)
+        assert events == [{"event_ticker": "EVT"}]
+        assert captured["method"] == "GET"
+        # The query must be interpolated, not sent as a literal placeholder.
+        assert "limit=5" in captured["url"]
+        assert "series_ticker=SER" in captured["url"]
+        assert "{" not in captured["url"]
+    finally:
+        await client.aclose()
 
 
 @pytest.mark.asyncio
@@ -125,10 +145,11 @@ async def test_create_order_sends_expected_body_and_parses_response(monkeypatch:
 
     captured: dict[str, Any] = {}
 
-    def fake_request(method: str, url: str, *, headers: dict[str, str], json: Any, timeout: int) -> _FakeResponse:
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
         captured["method"] = method
         captured["url"] = url
-        captured["json"] = json
+        captured["data"] = data
+        captured["content_type"] = headers.get("Content-Type")
         return _FakeResponse(
             {
                 "order": {
@@ -147,7 +168,7 @@ async def test_create_order_sends_expected_body_and_parses_response(monkeypatch:
             status_code=201,
         )
 
-    monkeypatch.setattr("kalshi.client.requests.request", fake_request)
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
 
     client = KalshiClient(_make_config())
     try:
@@ -156,7 +177,9 @@ async def test_create_order_sends_expected_body_and_parses_response(monkeypatch:
 
         assert captured["method"] == "POST"
         assert captured["url"] == "https://demo-api.kalshi.co/trade-api/v2/portfolio/orders"
-        assert captured["json"] == {
+        # Bodies are pre-encoded to JSON bytes and sent via data=.
+        assert captured["content_type"] == "application/json"
+        assert _json.loads(captured["data"]) == {
             "ticker": "ABC",
             "side": "yes",
             "action": "buy",
@@ -170,10 +193,96 @@ async def test_create_order_sends_expected_body_and_parses_response(monkeypatch:
         assert created.count == 2
         assert created.yes_price_dollars == 0.25
     finally:
-        if client._request_worker_task is not None:
-            client._request_worker_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await client._request_worker_task
+        await client.aclose()
+
+
+def _market_payload(ticker: str) -> dict[str, Any]:
+    return {
+        "ticker": ticker,
+        "event_ticker": f"EVT-{ticker}",
+        "close_time": "2030-01-01T00:00:00Z",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_markets_all_walks_cursor_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    dummy_key = _DummyPrivateKey()
+    monkeypatch.setattr("kalshi.client._load_private_key", lambda _pem: dummy_key)
+
+    urls: list[str] = []
+
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
+        urls.append(url)
+        assert method == "GET"
+        if "cursor=" not in url:
+            return _FakeResponse({"markets": [_market_payload("AAA")], "cursor": "CUR1"})
+        assert "cursor=CUR1" in url
+        # Empty cursor terminates the walk.
+        return _FakeResponse({"markets": [_market_payload("BBB")], "cursor": ""})
+
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
+
+    client = KalshiClient(_make_config())
+    try:
+        markets = await client.get_markets_all(status="open")
+        assert [m.ticker for m in markets] == ["AAA", "BBB"]
+        assert len(urls) == 2
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_market_tickers_walks_cursor_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    dummy_key = _DummyPrivateKey()
+    monkeypatch.setattr("kalshi.client._load_private_key", lambda _pem: dummy_key)
+
+    urls: list[str] = []
+
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
+        urls.append(url)
+        assert method == "GET"
+        if "cursor=" not in url:
+            return _FakeResponse({"markets": [{"ticker": "AAA"}, {"no_ticker": True}], "cursor": "CUR1"})
+        return _FakeResponse({"markets": [{"ticker": "BBB"}], "cursor": ""})
+
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
+
+    client = KalshiClient(_make_config())
+    try:
+        tickers = await client.get_market_tickers(series_ticker="ser")
+        # Entries without a ticker are skipped; no model validation runs.
+        assert tickers == ["AAA", "BBB"]
+        assert len(urls) == 2
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_returns_results_in_input_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    dummy_key = _DummyPrivateKey()
+    monkeypatch.setattr("kalshi.client._load_private_key", lambda _pem: dummy_key)
+
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
+        assert method == "GET"
+        if url.endswith("/portfolio/balance"):
+            return _FakeResponse({"balance": 100, "portfolio_value": 250, "updated_ts": 1})
+        assert url.endswith("/events/EVT")
+        return _FakeResponse({"event_ticker": "EVT"})
+
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
+
+    client = KalshiClient(_make_config())
+    try:
+        results = await client.fetch_many(
+            [
+                ("GET", "/trade-api/v2/portfolio/balance", None),
+                ("GET", "/trade-api/v2/events/EVT", None),
+            ]
+        )
+        assert results[0]["balance"] == 100
+        assert results[1]["event_ticker"] == "EVT"
+    finally:
+        await client.aclose()
 
 
 @pytest.mark.asyncio
@@ -181,21 +290,18 @@ async def test_cancel_order_returns_none(monkeypatch: pytest.MonkeyPatch) -> Non
     dummy_key = _DummyPrivateKey()
     monkeypatch.setattr("kalshi.client._load_private_key", lambda _pem: dummy_key)
 
-    def fake_request(method: str, url: str, *, headers: dict[str, str], json: Any, timeout: int) -> _FakeResponse:
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
         assert method == "DELETE"
         assert url == "https://demo-api.kalshi.co/trade-api/v2/portfolio/orders/OID"
         assert json is None
         return _FakeResponse(None, status_code=200, content=b"")
 
-    monkeypatch.setattr("kalshi.client.requests.request", fake_request)
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
 
     client = KalshiClient(_make_config())
     try:
         result = await client.cancel_order("OID")
         assert result is None
     finally:
-        if client._request_worker_task is not None:
-            client._request_worker_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await client._request_worker_task
+        await client.aclose()
 
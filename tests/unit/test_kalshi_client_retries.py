@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import suppress
+import json as _json
 from typing import Any
 
 import pytest
@@ -21,7 +21,7 @@ class _FakeResponse:
     def __init__(self, payload: dict[str, Any] | None, *, status_code: int, content: bytes | None = None) -> None:
         self._payload = payload
         self.status_code = status_code
-        self.content = content if content is not None else (b"{}" if payload is not None else b"")
+        self.content = content if content is not None else (_json.dumps(payload).encode() if payload is not None else b"")
 
     def json(self) -> dict[str, Any]:
         if self._payload is None:
@@ -46,7 +46,7 @@ def _make_config() -> KalshiConfig:
 @pytest.mark.asyncio
 async def test_retries_on_http_500_then_succeeds(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("kalshi.client._load_private_key", lambda _pem: _DummyPrivateKey())
-    monkeypatch.setattr("kalshi.client.random.uniform", lambda _a, _b: 0.0)
+    monkeypatch.setattr("kalshi.client.random.Random.uniform", lambda _self, _a, _b: 0.0)
 
     slept: list[float] = []
 
@@ -57,7 +57,7 @@ async def test_retries_on_http_500_then_succeeds(monkeypatch: pytest.MonkeyPatch
 
     calls = 0
 
-    def fake_request(method: str, url: str, *, headers: dict[str, str], json: Any, timeout: int) -> _FakeResponse:
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
         nonlocal calls
         calls += 1
         if calls < 3:
@@ -79,7 +79,7 @@ async def test_retries_on_http_500_then_succeeds(monkeypatch: pytest.MonkeyPatch
             status_code=200,
         )
 
-    monkeypatch.setattr("kalshi.client.requests.request", fake_request)
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
 
     client = KalshiClient(_make_config())
     try:
@@ -89,25 +89,22 @@ async def test_retries_on_http_500_then_succeeds(monkeypatch: pytest.MonkeyPatch
         assert calls == 3
         assert slept == [0.5, 1.0]
     finally:
-        if client._request_worker_task is not None:
-            client._request_worker_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await client._request_worker_task
+        await client.aclose()
 
 
 @pytest.mark.asyncio
 async def test_no_retry_on_http_400(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("kalshi.client._load_private_key", lambda _pem: _DummyPrivateKey())
-    monkeypatch.setattr("kalshi.client.random.uniform", lambda _a, _b: 0.0)
+    monkeypatch.setattr("kalshi.client.random.Random.uniform", lambda _self, _a, _b: 0.0)
 
     calls = 0
 
-    def fake_request(method: str, url: str, *, headers: dict[str, str], json: Any, timeout: int) -> _FakeResponse:
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
         nonlocal calls
         calls += 1
         return _FakeResponse({"message": "bad request"}, status_code=400)
 
-    monkeypatch.setattr("kalshi.client.requests.request", fake_request)
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
 
     client = KalshiClient(_make_config())
     try:
@@ -115,16 +112,13 @@ async def test_no_retry_on_http_400(monkeypatch: pytest.MonkeyPatch) -> None:
             await client.get_markets(limit=1)
         assert calls == 1
     finally:
-        if client._request_worker_task is not None:
-            client._request_worker_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await client._request_worker_task
+        await client.aclose()
 
 
 @pytest.mark.asyncio
 async def test_retries_on_transport_error(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("kalshi.client._load_private_key", lambda _pem: _DummyPrivateKey())
-    monkeypatch.setattr("kalshi.client.random.uniform", lambda _a, _b: 0.0)
+    monkeypatch.setattr("kalshi.client.random.Random.uniform", lambda _self, _a, _b: 0.0)
 
     slept: list[float] = []
 
@@ -135,7 +129,7 @@ async def test_retries_on_transport_error(monkeypatch: pytest.MonkeyPatch) -> No
 
     calls = 0
 
-    def fake_request(method: str, url: str, *, headers: dict[str, str], json: Any, timeout: int) -> _FakeResponse:
+    def fake_request(_session: Any, method: str, url: str, *, headers: dict[str, str], json: Any = None, data: Any = None, timeout: int = 30) -> _FakeResponse:
         nonlocal calls
         calls += 1
         if calls == 1:
@@ -145,7 +139,7 @@ async def test_retries_on_transport_error(monkeypatch: pytest.MonkeyPatch) -> No
             status_code=200,
         )
 
-    monkeypatch.setattr("kalshi.client.requests.request", fake_request)
+    monkeypatch.setattr("kalshi.client.requests.Session.request", fake_request)
 
     client = KalshiClient(_make_config())
     try:
@@ -154,8 +148,5 @@ async def test_retries_on_transport_error(monkeypatch: pytest.MonkeyPatch) -> No
         assert calls == 2
         assert slept == [0.5]
     finally:
-        if client._request_worker_task is not None:
-            client._request_worker_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await client._request_worker_task
+        await client.aclose()
 
@@ -41,6 +41,9 @@ class _FakeAdapter:
     async def get_order_status(self, venue_order_id: str) -> tuple[str, int]:
         return self._orders[venue_order_id]
 
+    async def get_orders_status(self, venue_order_ids: list[str]) -> dict[str, tuple[str, int]]:
+        return {vid: self._orders[vid] for vid in venue_order_ids if vid in self._orders}
+
     async def get_positions_snapshot(self) -> PositionSnapshot:
         return PositionSnapshot(venue="kalshi", positions=[])
 
@@ -68,13 +71,12 @@ async def test_engine_and_pm_message_flow_submit_poll_fill_cancel() -> None:
         config=_PM_CONFIG,
     )
 
-    # Capture events directly for assertions.
-    event_q = execution_event_bus.subscribe()
-
     engine_task = asyncio.create_task(engine.run())
     pm_task = asyncio.create_task(pm.run())
     try:
         trade_id = "t1"
+        # Register one-shot waiters before triggering so no event can slip by.
+        update_fut = execution_event_bus.wait_for(lambda e: e.type == "order_update")
         await pm.submit_order(
             OrderRequest(
                 trade_id=trade_id,
@@ -93,42 +95,22 @@ async def test_engine_and_pm_message_flow_submit_poll_fill_cancel() -> None:
         assert venue_order_id.startswith("OID")
 
         # Wait for an order_update (first poll should transition from submitted -> resting).
-        seen_update = False
-        deadline = asyncio.get_running_loop().time() + 2.0
-        while asyncio.get_running_loop().time() < deadline:
-            ev = await asyncio.wait_for(event_q.get(), timeout=2.0)
-            if ev.type == "order_update":
-                seen_update = True
-                break
-        assert seen_update
+        ev = await asyncio.wait_for(update_fut, timeout=2.0)
+        assert ev.type == "order_update"
 
         # Simulate fill progress and terminal status.
+        fill_fut = execution_event_bus.wait_for(lambda e: e.type == "fill_update")
         adapter.set_order(venue_order_id, fill_count=1)
         adapter.set_order(venue_order_id, status="executed")
 
-        seen_fill = False
-        seen_executed = False
-        deadline = asyncio.get_running_loop().time() + 2.0
-        while asyncio.get_running_loop().time() < deadline and not (seen_fill and seen_executed):
-            ev = await asyncio.wait_for(event_q.get(), timeout=2.0)
-            if ev.type == "fill_update":
-                seen_fill = True
-            if ev.type == "order_update" and getattr(ev, "status", "") == "executed":
-                seen_executed = True
-        assert seen_fill
-        assert seen_executed
+        ev = await asyncio.wait_for(fill_fut, timeout=2.0)
+        assert ev.type == "fill_update"
+        # Keyed wait instead of draining the bus queue (raises TimeoutError on failure).
+        await pm.wait_for_order_executed(venue_order_id, timeout_s=2.0)
 
         # Canceling an executed order will still exercise the command path; adapter will mark canceled.
         await pm.cancel_order(venue_order_id, reason="test")
-        # Wait for order_canceled event.
-        seen_canceled = False
-        deadline = asyncio.get_running_loop().time() + 2.0
-        while asyncio.get_running_loop().time() < deadline:
-            ev = await asyncio.wait_for(event_q.get(), timeout=2.0)
-            if ev.type == "order_canceled":
-                seen_canceled = True
-                break
-        assert seen_canceled
+        await pm.wait_for_order_canceled(venue_order_id, timeout_s=2.0)
     finally:
         for t in [pm_task, engine_task]:
             t.cancel()